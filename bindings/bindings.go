@@ -3,13 +3,16 @@ package exports
 import (
 	"context"
 	"crypto/sha256"
+	"encoding/binary"
 	"encoding/json"
 	"fmt"
 	"log"
+	"math"
 	"os"
 	"reflect"
 	"strconv"
 	"strings"
+	"sync"
 	"time"
 
 	"github.com/cockroachdb/apd/v3"
@@ -36,8 +39,8 @@ const (
 )
 
 type OptionalInt64 struct {
-	Value int64
-	IsSet bool
+	Value int64 `json:"value"`
+	IsSet bool  `json:"is_set"`
 }
 
 func toOptionalInt64(value *int64) OptionalInt64 {
@@ -388,6 +391,56 @@ func NewInsertRecordInputForProvider(dataProvider string, streamId string, date
 	}
 }
 
+// NewInsertRecordInputsBulk builds the []types.InsertRecordInput for
+// InsertRecords from parallel stream / date / value columns in a single
+// binding call. The data provider is resolved once, from the client signer.
+//
+// The stream column is dictionary-encoded: streamIdTable lists each distinct
+// stream id once and streamIdx holds, per record, a packed native-endian
+// int32 index into it, so a stream id shared by many records is sent once.
+// dates and values are packed native-endian int64 / float64 buffers (Python
+// array('q').tobytes() / array('d').tobytes()): a []byte crosses gopy as one
+// copy, whereas []int64 / []float64 are filled one element per call.
+func NewInsertRecordInputsBulk(client *tnclient.Client, streamIdTable []string, streamIdx []byte, dates []byte, values []byte) ([]types.InsertRecordInput, error) {
+	n := len(streamIdx) / 4
+	if len(streamIdx) != 4*n || len(dates) != 8*n || len(values) != 8*n {
+		return nil, fmt.Errorf("mismatched record columns: %d stream index bytes, %d date bytes, %d value bytes",
+			len(streamIdx), len(dates), len(values))
+	}
+
+	dataProvider, err := GetCurrentAccount(client)
+	if err != nil {
+		return nil, errors.Wrap(err, "error resolving data provider")
+	}
+
+	inputs := make([]types.InsertRecordInput, n)
+	for i := range inputs {
+		k := int(int32(binary.NativeEndian.Uint32(streamIdx[4*i:])))
+		if k < 0 || k >= len(streamIdTable) {
+			return nil, fmt.Errorf("record %d: stream index %d out of range for %d stream ids",
+				i, k, len(streamIdTable))
+		}
+		inputs[i] = types.InsertRecordInput{
+			StreamId:     streamIdTable[k],
+			DataProvider: dataProvider,
+			EventTime:    int(int64(binary.NativeEndian.Uint64(dates[8*i:]))),
+			Value:        math.Float64frombits(binary.NativeEndian.Uint64(values[8*i:])),
+		}
+	}
+	return inputs, nil
+}
+
+// InsertRecordsColumnar inserts records given as parallel columns (see
+// NewInsertRecordInputsBulk for the column layout) in a single transaction,
+// without handing the []types.InsertRecordInput back to the caller first.
+func InsertRecordsColumnar(client *tnclient.Client, streamIdTable []string, streamIdx []byte, dates []byte, values []byte) (string, error) {
+	inputs, err := NewInsertRecordInputsBulk(client, streamIdTable, streamIdx, dates, values)
+	if err != nil {
+		return "", err
+	}
+	return InsertRecords(client, inputs)
+}
+
 // NewGetRecordInput creates a new GetRecordInput struct
 func NewGetRecordInput(
 	client *tnclient.Client,
@@ -467,6 +520,61 @@ func GetRecords(client *tnclient.Client, input types.GetRecordInput) (DataRespon
 	return result, nil
 }
 
+// RecordColumns holds query results as two packed little-endian buffers:
+// Dates is Count int64 event times, Values is Count float64 values.
+// Python views them with numpy.frombuffer without touching individual rows.
+type RecordColumns struct {
+	Count    int
+	Dates    []byte
+	Values   []byte
+	CacheHit bool
+	Height   OptionalInt64
+}
+
+func newRecordColumns(count int) *RecordColumns {
+	return &RecordColumns{
+		Count:  count,
+		Dates:  make([]byte, 8*count),
+		Values: make([]byte, 8*count),
+	}
+}
+
+// put stores the i-th record; value is the decimal string form from the node.
+func (c *RecordColumns) put(i int, eventTime int, value string) error {
+	v, err := strconv.ParseFloat(value, 64)
+	if err != nil {
+		return errors.Wrapf(err, "record %d: invalid value %q", i, value)
+	}
+	binary.LittleEndian.PutUint64(c.Dates[8*i:], uint64(int64(eventTime)))
+	binary.LittleEndian.PutUint64(c.Values[8*i:], math.Float64bits(v))
+	return nil
+}
+
+// GetRecordsColumnar is GetRecords returning packed columns instead of a
+// []Record, so large result sets cross the binding as two byte buffers.
+func GetRecordsColumnar(client *tnclient.Client, input types.GetRecordInput) (*RecordColumns, error) {
+	ctx := context.Background()
+	stream, err := client.LoadPrimitiveActions()
+	if err != nil {
+		return nil, err
+	}
+
+	response, err := stream.GetRecord(ctx, input)
+	if err != nil {
+		return nil, err
+	}
+
+	cols := newRecordColumns(len(response.Results))
+	for i, record := range response.Results {
+		if err := cols.put(i, record.EventTime, record.Value.String()); err != nil {
+			return nil, err
+		}
+	}
+	cols.CacheHit = response.Metadata.CacheHit
+	cols.Height = toOptionalInt64(response.Metadata.CacheHeight)
+	return cols, nil
+}
+
 // GetType retrieves type of a stream (primitive or composed)
 func GetType(client *tnclient.Client, streamId string, dataProvider string) (types.StreamType, error) {
 	streamIdTyped, err := util.NewStreamId(streamId)
@@ -564,6 +672,46 @@ func GetFirstRecord(client *tnclient.Client, input types.GetFirstRecordInput) (D
 	return result, nil
 }
 
+// FirstRecordResult is the flat, typed result of GetFirstRecordTyped. Found
+// is false when there is no record in range; Date and Value are zero then.
+type FirstRecordResult struct {
+	Found    bool
+	Date     int
+	Value    float64
+	CacheHit bool
+	Height   OptionalInt64
+}
+
+// GetFirstRecordTyped is GetFirstRecord with a fixed-shape result: no
+// one-element slice to unwrap and the value already parsed to float64.
+func GetFirstRecordTyped(client *tnclient.Client, input types.GetFirstRecordInput) (*FirstRecordResult, error) {
+	ctx := context.Background()
+	stream, err := client.LoadPrimitiveActions()
+	if err != nil {
+		return nil, err
+	}
+
+	// Same empty-result semantics as GetFirstRecord: no results means not found.
+	record, _ := stream.GetFirstRecord(ctx, input)
+
+	result := &FirstRecordResult{
+		CacheHit: record.Metadata.CacheHit,
+		Height:   toOptionalInt64(record.Metadata.CacheHeight),
+	}
+	if len(record.Results) == 0 {
+		return result, nil
+	}
+
+	value, err := strconv.ParseFloat(record.Results[0].Value.String(), 64)
+	if err != nil {
+		return nil, errors.Wrapf(err, "invalid record value %q", record.Results[0].Value.String())
+	}
+	result.Found = true
+	result.Date = record.Results[0].EventTime
+	result.Value = value
+	return result, nil
+}
+
 // GetIndex retrieves index values from a stream
 func GetIndex(client *tnclient.Client, input types.GetIndexInput) (DataResponse, error) {
 	ctx := context.Background()
@@ -597,6 +745,54 @@ func GetIndex(client *tnclient.Client, input types.GetIndexInput) (DataResponse,
 	return result, nil
 }
 
+// GetIndexColumnar is GetIndex returning packed columns (see RecordColumns).
+func GetIndexColumnar(client *tnclient.Client, input types.GetIndexInput) (*RecordColumns, error) {
+	ctx := context.Background()
+	stream, err := client.LoadPrimitiveActions()
+	if err != nil {
+		return nil, err
+	}
+
+	response, err := stream.GetIndex(ctx, input)
+	if err != nil {
+		return nil, err
+	}
+
+	cols := newRecordColumns(len(response.Results))
+	for i, index := range response.Results {
+		if err := cols.put(i, index.EventTime, index.Value.String()); err != nil {
+			return nil, err
+		}
+	}
+	cols.CacheHit = response.Metadata.CacheHit
+	cols.Height = toOptionalInt64(response.Metadata.CacheHeight)
+	return cols, nil
+}
+
+// marshalDataResponse encodes a DataResponse as a JSON string. Returning the
+// whole result as one string lets Python decode it in a single call instead of
+// walking a gopy []Record wrapper field by field.
+func marshalDataResponse(response DataResponse, err error) (string, error) {
+	if err != nil {
+		return "", err
+	}
+	out, err := json.Marshal(response)
+	if err != nil {
+		return "", errors.Wrap(err, "error marshaling records")
+	}
+	return string(out), nil
+}
+
+// GetRecordsJSON is GetRecords returning the DataResponse as a JSON string.
+func GetRecordsJSON(client *tnclient.Client, input types.GetRecordInput) (string, error) {
+	return marshalDataResponse(GetRecords(client, input))
+}
+
+// GetIndexJSON is GetIndex returning the DataResponse as a JSON string.
+func GetIndexJSON(client *tnclient.Client, input types.GetIndexInput) (string, error) {
+	return marshalDataResponse(GetIndex(client, input))
+}
+
 // NewListStreamsInput creates a new ListStreamsInput struct
 func NewListStreamsInput(limit int, offset int, dataProvider string, orderBy string, blockHeight int) types.ListStreamsInput {
 	result := types.ListStreamsInput{
@@ -631,6 +827,11 @@ func ListStreams(client *tnclient.Client, input types.ListStreamsInput) ([]map[s
 	return recordsToMapSlice(streams), nil
 }
 
+// ListStreamsJSON is ListStreams returning its rows as a JSON array.
+func ListStreamsJSON(client *tnclient.Client, input types.ListStreamsInput) (string, error) {
+	return marshalRows(ListStreams(client, input))
+}
+
 // NewTaxonomyItemInput creates a new TaxonomyItemInput struct
 func NewTaxonomyItemInput(client *tnclient.Client, dataProvider string, stream_id string, weight float64) types.TaxonomyItem {
 	streamIdObj, err := util.NewStreamId(stream_id)
@@ -1048,6 +1249,31 @@ func WaitForTx(client *tnclient.Client, txHashHex string) error {
 	return nil
 }
 
+// WaitForTxs waits for several transactions concurrently and returns once all
+// of them are confirmed, so a caller that broadcast N transactions pays one
+// inclusion round-trip instead of N serial ones. The error, if any, is the
+// failure of the earliest hash in txHashes order.
+func WaitForTxs(client *tnclient.Client, txHashes []string) error {
+	errs := make([]error, len(txHashes))
+
+	var wg sync.WaitGroup
+	for i, txHash := range txHashes {
+		wg.Add(1)
+		go func(i int, txHash string) {
+			defer wg.Done()
+			errs[i] = WaitForTx(client, txHash)
+		}(i, txHash)
+	}
+	wg.Wait()
+
+	for i, err := range errs {
+		if err != nil {
+			return errors.Wrapf(err, "tx %d (%s)", i, txHashes[i])
+		}
+	}
+	return nil
+}
+
 // /*****************************************
 //  *            Helper Functions           *
 //  *****************************************/
@@ -1179,6 +1405,26 @@ func NewStreamDefinitionForBinding(streamIdStr string, streamTypeStr string, all
 	}, nil
 }
 
+// NewStreamDefinitionsBatch builds the whole []types.StreamDefinition for
+// BatchDeployStreams from parallel columns in a single binding call, instead
+// of one NewStreamDefinitionForBinding round-trip per definition.
+func NewStreamDefinitionsBatch(streamIds []string, streamTypes []string, allowZeros []bool) ([]types.StreamDefinition, error) {
+	if len(streamIds) != len(streamTypes) || len(streamIds) != len(allowZeros) {
+		return nil, fmt.Errorf("mismatched definition columns: %d stream ids, %d stream types, %d allow_zeros flags",
+			len(streamIds), len(streamTypes), len(allowZeros))
+	}
+
+	definitions := make([]types.StreamDefinition, len(streamIds))
+	for i := range streamIds {
+		def, err := NewStreamDefinitionForBinding(streamIds[i], streamTypes[i], allowZeros[i])
+		if err != nil {
+			return nil, errors.Wrapf(err, "definitions[%d]", i)
+		}
+		definitions[i] = *def
+	}
+	return definitions, nil
+}
+
 // NewStreamLocatorForBinding creates a new types.StreamLocator for binding purposes.
 func NewStreamLocatorForBinding(streamIdStr string, dataProviderAddressStr string) (*types.StreamLocator, error) {
 	sid, err := util.NewStreamId(streamIdStr)
@@ -1206,8 +1452,23 @@ func BatchDeployStreams(client *tnclient.Client, definitions []types.StreamDefin
 	return txHash.String(), nil
 }
 
+// BatchDeployStreamsColumnar builds the stream definitions from parallel
+// id / type / allow_zeros columns and deploys them, so a batch deploy is a
+// single binding call with no []types.StreamDefinition round trip through
+// the host language.
+func BatchDeployStreamsColumnar(client *tnclient.Client, streamIds []string, streamTypes []string, allowZeros []bool) (string, error) {
+	definitions, err := NewStreamDefinitionsBatch(streamIds, streamTypes, allowZeros)
+	if err != nil {
+		return "", err
+	}
+	return BatchDeployStreams(client, definitions)
+}
+
 // BatchStreamExists checks for the existence of multiple streams.
 // It expects a slice of types.StreamLocator and returns a slice of maps.
+// The map shape forces "exists" through strconv.FormatBool; callers that want
+// a native bool should use BatchStreamExistsJSON, whose "exists" field is a
+// JSON boolean (the Python SDK decodes it directly).
 func BatchStreamExists(client *tnclient.Client, locators []types.StreamLocator) ([]map[string]string, error) {
 	ctx := context.Background()
 	results, err := client.BatchStreamExists(ctx, locators)
@@ -1245,6 +1506,177 @@ func BatchFilterStreamsByExistence(client *tnclient.Client, locators []types.Str
 	return output, nil
 }
 
+// StreamLocatorColumns holds stream locators as parallel columns.
+// Struct-of-slices is the gopy-friendly return shape: Python reads three
+// primitive slices instead of converting one Go map per row.
+type StreamLocatorColumns struct {
+	StreamIds     []string
+	DataProviders []string
+}
+
+// StreamExistsColumns is the columnar result of BatchStreamExistsColumnar.
+type StreamExistsColumns struct {
+	StreamIds     []string
+	DataProviders []string
+	Exists        []bool
+}
+
+// newStreamLocators builds []types.StreamLocator from parallel id/provider
+// columns. An empty data provider resolves to the client's own address.
+func newStreamLocators(client *tnclient.Client, streamIds []string, dataProviders []string) ([]types.StreamLocator, error) {
+	if len(streamIds) != len(dataProviders) {
+		return nil, fmt.Errorf("mismatched locator columns: %d stream ids, %d data providers",
+			len(streamIds), len(dataProviders))
+	}
+
+	locators := make([]types.StreamLocator, len(streamIds))
+	for i := range streamIds {
+		sid, err := util.NewStreamId(streamIds[i])
+		if err != nil {
+			return nil, errors.Wrapf(err, "error creating stream id from string: %s", streamIds[i])
+		}
+		dp, err := parseDataProvider(client, dataProviders[i])
+		if err != nil {
+			return nil, errors.Wrapf(err, "error creating ethereum address from string: %s", dataProviders[i])
+		}
+		locators[i] = types.StreamLocator{StreamId: *sid, DataProvider: dp}
+	}
+	return locators, nil
+}
+
+// NewTaxonomyItemsColumnar builds the []types.TaxonomyItem for NewTaxonomyInput
+// from parallel child stream id / data provider / weight columns in a single
+// binding call. An empty data provider resolves to the client's own address.
+// Unlike NewTaxonomyItemInput, an invalid stream id or provider is reported
+// as an error instead of yielding a zero-valued item.
+func NewTaxonomyItemsColumnar(client *tnclient.Client, streamIds []string, dataProviders []string, weights []float64) ([]types.TaxonomyItem, error) {
+	if len(weights) != len(streamIds) {
+		return nil, fmt.Errorf("mismatched taxonomy columns: %d stream ids, %d weights",
+			len(streamIds), len(weights))
+	}
+	locators, err := newStreamLocators(client, streamIds, dataProviders)
+	if err != nil {
+		return nil, err
+	}
+
+	items := make([]types.TaxonomyItem, len(locators))
+	for i, locator := range locators {
+		items[i] = types.TaxonomyItem{ChildStream: locator, Weight: weights[i]}
+	}
+	return items, nil
+}
+
+// BatchStreamExistsColumnar checks the existence of multiple streams given as
+// parallel id/provider columns. The locator slice is built on the Go side, so
+// the whole check is a single binding call.
+func BatchStreamExistsColumnar(client *tnclient.Client, streamIds []string, dataProviders []string) (*StreamExistsColumns, error) {
+	locators, err := newStreamLocators(client, streamIds, dataProviders)
+	if err != nil {
+		return nil, err
+	}
+
+	ctx := context.Background()
+	results, err := client.BatchStreamExists(ctx, locators)
+	if err != nil {
+		return nil, errors.Wrap(err, "error checking batch stream existence")
+	}
+
+	out := &StreamExistsColumns{
+		StreamIds:     make([]string, len(results)),
+		DataProviders: make([]string, len(results)),
+		Exists:        make([]bool, len(results)),
+	}
+	for i, res := range results {
+		out.StreamIds[i] = res.StreamLocator.StreamId.String()
+		out.DataProviders[i] = res.StreamLocator.DataProvider.Address()
+		out.Exists[i] = res.Exists
+	}
+	return out, nil
+}
+
+// streamExistsEntry is one element of the BatchStreamExistsJSON result.
+type streamExistsEntry struct {
+	StreamId     string `json:"stream_id"`
+	DataProvider string `json:"data_provider"`
+	Exists       bool   `json:"exists"`
+}
+
+// BatchStreamExistsJSON is BatchStreamExistsColumnar returning a JSON array of
+// {"stream_id", "data_provider", "exists"} objects, the shape the Python SDK
+// returns, so the result crosses the binding as one string instead of three
+// slices read element by element.
+func BatchStreamExistsJSON(client *tnclient.Client, streamIds []string, dataProviders []string) (string, error) {
+	cols, err := BatchStreamExistsColumnar(client, streamIds, dataProviders)
+	if err != nil {
+		return "", err
+	}
+
+	entries := make([]streamExistsEntry, len(cols.StreamIds))
+	for i := range entries {
+		entries[i] = streamExistsEntry{
+			StreamId:     cols.StreamIds[i],
+			DataProvider: cols.DataProviders[i],
+			Exists:       cols.Exists[i],
+		}
+	}
+	out, err := json.Marshal(entries)
+	if err != nil {
+		return "", errors.Wrap(err, "error marshaling stream existence results")
+	}
+	return string(out), nil
+}
+
+// BatchFilterStreamsByExistenceColumnar is the columnar counterpart of
+// BatchFilterStreamsByExistence.
+func BatchFilterStreamsByExistenceColumnar(client *tnclient.Client, streamIds []string, dataProviders []string, returnExisting bool) (*StreamLocatorColumns, error) {
+	locators, err := newStreamLocators(client, streamIds, dataProviders)
+	if err != nil {
+		return nil, err
+	}
+
+	ctx := context.Background()
+	results, err := client.BatchFilterStreamsByExistence(ctx, locators, returnExisting)
+	if err != nil {
+		return nil, errors.Wrap(err, "error filtering batch streams by existence")
+	}
+
+	out := &StreamLocatorColumns{
+		StreamIds:     make([]string, len(results)),
+		DataProviders: make([]string, len(results)),
+	}
+	for i, res := range results {
+		out.StreamIds[i] = res.StreamId.String()
+		out.DataProviders[i] = res.DataProvider.Address()
+	}
+	return out, nil
+}
+
+// streamLocatorEntry is one element of the BatchFilterStreamsByExistenceJSON
+// result.
+type streamLocatorEntry struct {
+	StreamId     string `json:"stream_id"`
+	DataProvider string `json:"data_provider"`
+}
+
+// BatchFilterStreamsByExistenceJSON is BatchFilterStreamsByExistenceColumnar
+// returning a JSON array of {"stream_id", "data_provider"} objects.
+func BatchFilterStreamsByExistenceJSON(client *tnclient.Client, streamIds []string, dataProviders []string, returnExisting bool) (string, error) {
+	cols, err := BatchFilterStreamsByExistenceColumnar(client, streamIds, dataProviders, returnExisting)
+	if err != nil {
+		return "", err
+	}
+
+	entries := make([]streamLocatorEntry, len(cols.StreamIds))
+	for i := range entries {
+		entries[i] = streamLocatorEntry{StreamId: cols.StreamIds[i], DataProvider: cols.DataProviders[i]}
+	}
+	out, err := json.Marshal(entries)
+	if err != nil {
+		return "", errors.Wrap(err, "error marshaling stream locators")
+	}
+	return string(out), nil
+}
+
 // helper to convert slice of hex wallet strings to []util.EthereumAddress
 func strSliceToEthAddrs(wallets []string) ([]util.EthereumAddress, error) {
 	out := make([]util.EthereumAddress, len(wallets))
@@ -1365,6 +1797,84 @@ func ListRoleMembers(client *tnclient.Client, owner string, roleName string, lim
 	return recordsToMapSlice(results), nil
 }
 
+// marshalRows encodes the []map[string]string rows of a binding call as one
+// JSON array, so Python decodes the whole result at once instead of crossing
+// the binding for every map and key.
+func marshalRows(rows []map[string]string, err error) (string, error) {
+	if err != nil {
+		return "", err
+	}
+	if rows == nil {
+		rows = []map[string]string{} // encode as [], not null
+	}
+	out, err := json.Marshal(rows)
+	if err != nil {
+		return "", errors.Wrap(err, "error marshaling rows")
+	}
+	return string(out), nil
+}
+
+// roleMembershipEntry is one element of the AreMembersOfJSON result, in the
+// Python SDK's RoleMembershipStatus shape.
+type roleMembershipEntry struct {
+	Wallet   string `json:"wallet"`
+	IsMember bool   `json:"is_member"`
+}
+
+// AreMembersOfJSON is AreMembersOf returning a JSON array of
+// {"wallet", "is_member"} objects, with is_member a native JSON boolean.
+func AreMembersOfJSON(client *tnclient.Client, owner string, roleName string, wallets []string) (string, error) {
+	rows, err := AreMembersOf(client, owner, roleName, wallets)
+	if err != nil {
+		return "", err
+	}
+
+	entries := make([]roleMembershipEntry, len(rows))
+	for i, row := range rows {
+		isMember, _ := strconv.ParseBool(row["IsMember"])
+		entries[i] = roleMembershipEntry{Wallet: row["Wallet"], IsMember: isMember}
+	}
+	out, err := json.Marshal(entries)
+	if err != nil {
+		return "", errors.Wrap(err, "error marshaling role membership")
+	}
+	return string(out), nil
+}
+
+// roleMemberEntry is one element of the ListRoleMembersJSON result, in the
+// Python SDK's RoleMember shape.
+type roleMemberEntry struct {
+	Wallet    string `json:"wallet"`
+	GrantedAt int64  `json:"granted_at"`
+	GrantedBy string `json:"granted_by"`
+}
+
+// ListRoleMembersJSON is ListRoleMembers returning a JSON array of
+// {"wallet", "granted_at", "granted_by"} objects, with granted_at already
+// an integer.
+func ListRoleMembersJSON(client *tnclient.Client, owner string, roleName string, limit int, offset int) (string, error) {
+	rows, err := ListRoleMembers(client, owner, roleName, limit, offset)
+	if err != nil {
+		return "", err
+	}
+
+	entries := make([]roleMemberEntry, len(rows))
+	for i, row := range rows {
+		// An unparseable timestamp is reported as 0, as the SDK always has.
+		grantedAt, _ := strconv.ParseInt(row["GrantedAt"], 10, 64)
+		entries[i] = roleMemberEntry{
+			Wallet:    row["Wallet"],
+			GrantedAt: grantedAt,
+			GrantedBy: row["GrantedBy"],
+		}
+	}
+	out, err := json.Marshal(entries)
+	if err != nil {
+		return "", errors.Wrap(err, "error marshaling role members")
+	}
+	return string(out), nil
+}
+
 // CallProcedure executes a read-only stored procedure and returns its query result in a JSON-like map.
 // The returned map has two keys:
 //   - "column_names": []string – names of the columns returned by the procedure
@@ -1591,6 +2101,11 @@ func ListAttestations(
 	return output, nil
 }
 
+// ListAttestationsJSON is ListAttestations returning its rows as a JSON array.
+func ListAttestationsJSON(client *tnclient.Client, requester []byte, limit int, offset int, orderBy string) (string, error) {
+	return marshalRows(ListAttestations(client, requester, limit, offset, orderBy))
+}
+
 // ParseAttestationPayload parses a canonical attestation payload (without signature)
 // Returns a JSON string containing the parsed payload structure
 func ParseAttestationPayload(payload []byte) (string, error) {
@@ -1787,6 +2302,12 @@ func ListTransactionFees(
 	return response, nil
 }
 
+// ListTransactionFeesJSON is ListTransactionFees returning its rows as a JSON
+// array.
+func ListTransactionFeesJSON(client *tnclient.Client, wallet string, mode string, limit int, offset int) (string, error) {
+	return marshalRows(ListTransactionFees(client, wallet, mode, limit, offset))
+}
+
 // ═══════════════════════════════════════════════════════════════
 //           ORDER BOOK FUNCTIONS
 // ═══════════════════════════════════════════════════════════════
@@ -1,35 +1,44 @@
-from .bulk_inserter import BulkInserter, BulkInsertError
-from .client import (
-    TNClient,
-    LocalClient,
-    LocalStreamInfo,
-    LocalRecord,
-    LocalIndex,
-    Record,
-    RecordBatch,
-    StreamDefinitionInput,
-    StreamLocatorInput,
-    StreamExistsResult,
-    ParsedAttestationPayload,
-    AttestationSignatureVerification,
-    MAANumericArg,
-    MAACreateRuleResult,
-    MAAJoinResult,
-    MAARule,
-    MAAAllowedAction,
-    MAAInstance,
-    MAAEvent,
-    STREAM_TYPE_PRIMITIVE,
-    STREAM_TYPE_COMPOSED,
-    VISIBILITY_PUBLIC,
-    VISIBILITY_PRIVATE
-)
-from .utils import (
-    compute_rules_hash,
-    derive_rule_id,
-    derive_maa_address,
-    derive_maa_address_hex,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .bulk_inserter import BulkInserter, BulkInsertError
+    from .client import (
+        TNClient,
+        LocalClient,
+        LocalStreamInfo,
+        LocalRecord,
+        LocalIndex,
+        Record,
+        RecordTuple,
+        RecordBatch,
+        StreamDefinitionInput,
+        StreamLocatorInput,
+        StreamExistsResult,
+        WalletSet,
+        ParsedAttestationPayload,
+        AttestationSignatureVerification,
+        AttestationNotReadyError,
+        AttestationRecord,
+        SIGNATURE_OVERHEAD,
+        MAANumericArg,
+        MAACreateRuleResult,
+        MAAJoinResult,
+        MAARule,
+        MAAAllowedAction,
+        MAAInstance,
+        MAAEvent,
+        STREAM_TYPE_PRIMITIVE,
+        STREAM_TYPE_COMPOSED,
+        VISIBILITY_PUBLIC,
+        VISIBILITY_PRIVATE
+    )
+    from .utils import (
+        compute_rules_hash,
+        derive_rule_id,
+        derive_maa_address,
+        derive_maa_address_hex,
+    )
 
 __all__ = [
     "TNClient",
@@ -38,12 +47,17 @@ __all__ = [
     "LocalRecord",
     "LocalIndex",
     "Record",
+    "RecordTuple",
     "RecordBatch",
     "StreamDefinitionInput",
     "StreamLocatorInput",
     "StreamExistsResult",
+    "WalletSet",
     "ParsedAttestationPayload",
     "AttestationSignatureVerification",
+    "AttestationNotReadyError",
+    "AttestationRecord",
+    "SIGNATURE_OVERHEAD",
     "MAANumericArg",
     "MAACreateRuleResult",
     "MAAJoinResult",
@@ -62,3 +76,27 @@ __all__ = [
     "BulkInserter",
     "BulkInsertError",
 ]
+
+# Submodule defining each public name. Submodules are imported on first
+# attribute access (PEP 562), so importing the package doesn't load pydantic
+# or the Go bindings until something is actually used.
+_EXPORTS = {
+    "BulkInserter": ".bulk_inserter",
+    "BulkInsertError": ".bulk_inserter",
+    "compute_rules_hash": ".utils",
+    "derive_rule_id": ".utils",
+    "derive_maa_address": ".utils",
+    "derive_maa_address_hex": ".utils",
+}
+
+
+def __getattr__(name: str):
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS.get(name, ".client"), __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -36,7 +36,7 @@ from typing import List, Optional
 
 import trufnetwork_sdk_c_bindings.exports as truf_sdk
 
-from .client import RecordBatch, TNClient
+from .client import RecordBatch, TNClient, _record_pairs
 
 
 class BulkInsertError(Exception):
@@ -190,13 +190,13 @@ class BulkInserter:
             stream_id = batch["stream_id"]
             if not stream_id:
                 raise BulkInsertError("batch is missing stream_id")
-            for record in batch["inputs"]:
+            for date, value in _record_pairs(batch["inputs"]):
                 go_inputs.append(
                     truf_sdk.NewInsertRecordInputForProvider(
                         data_provider,
                         stream_id,
-                        record["date"],
-                        record["value"],
+                        date,
+                        value,
                     )
                 )
 
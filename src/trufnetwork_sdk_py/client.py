@@ -24,15 +24,30 @@ See tests in `tests/test_cache_support.py` for working examples.
 """
 
 import json
+import sys
+import threading
 import warnings
+from array import array
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from itertools import chain
+from operator import itemgetter
 
 import trufnetwork_sdk_c_bindings.exports as truf_sdk
 import trufnetwork_sdk_c_bindings.go as go
 
-from typing import Any, TypedDict, Literal, cast, overload, Generic, TypeVar, Optional, Required
+from typing import Any, ClassVar, Iterable, NamedTuple, TypedDict, Literal, cast, overload, Generic, TypeVar, Optional, Required
 
 from pydantic import BaseModel
 
+try:
+    # Optional C decoder for the JSON blobs returned by the Go bindings
+    # (pip install "trufnetwork_sdk_py[fast]"); falls back to the stdlib.
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 
 T = TypeVar("T")
 
@@ -45,15 +60,64 @@ STREAM_TYPE_COMPOSED = cast(Literal["composed"], truf_sdk.StreamTypeComposed)
 VISIBILITY_PUBLIC = truf_sdk.VisibilityPublic
 VISIBILITY_PRIVATE = truf_sdk.VisibilityPrivate
 
+# Size of the signature (R || S || V) appended to a signed attestation payload
+SIGNATURE_OVERHEAD = 65
+
+_VISIBILITY_BY_NAME = {"public": VISIBILITY_PUBLIC, "private": VISIBILITY_PRIVATE}
+_VISIBILITY_NAMES = {value: name for name, value in _VISIBILITY_BY_NAME.items()}
+
+# Binding entry points used on the record insert/query and other high-frequency
+# read paths, bound once so calls skip the attribute lookup on the gopy module.
+_NewInsertRecordInput = truf_sdk.NewInsertRecordInput
+_NewInsertRecordInputsBulk = truf_sdk.NewInsertRecordInputsBulk
+_InsertRecord = truf_sdk.InsertRecord
+_InsertRecords = truf_sdk.InsertRecords
+_InsertRecordsColumnar = truf_sdk.InsertRecordsColumnar
+_WaitForTx = truf_sdk.WaitForTx
+_WaitForTxs = truf_sdk.WaitForTxs
+_NewGetRecordInput = truf_sdk.NewGetRecordInput
+_GetRecordsJSON = truf_sdk.GetRecordsJSON
+_GetIndexJSON = truf_sdk.GetIndexJSON
+_CallProcedureStrings = truf_sdk.CallProcedureStrings
+_BatchStreamExistsJSON = truf_sdk.BatchStreamExistsJSON
+_AreMembersOfJSON = truf_sdk.AreMembersOfJSON
+_Slice_string = go.Slice_string
+_Slice_float64 = go.Slice_float64
+_Slice_bool = go.Slice_bool
+_Slice_byte_from_bytes = go.Slice_byte.from_bytes
+
 
 class Record(TypedDict):
     date: int  # UNIX
     value: float
 
 
+class RecordTuple(NamedTuple):
+    """Tuple form of Record; insert paths unpack it without per-field dict lookups."""
+    date: int  # UNIX
+    value: float
+
+
 class RecordBatch(TypedDict):
     stream_id: str
-    inputs: list[Record]
+    inputs: list[Record] | list[RecordTuple]
+
+
+_record_fields = itemgetter("date", "value")
+
+
+def _record_pairs(
+        records: list[Record] | list[RecordTuple],
+) -> Iterable[tuple[int, float]]:
+    """
+    Iterate (date, value) pairs from a homogeneous list of records.
+
+    The record type is checked once: RecordTuple rows unpack as-is, Record
+    dicts go through a C-level itemgetter instead of two subscripts per row.
+    """
+    if records and isinstance(records[0], tuple):
+        return cast(list[RecordTuple], records)
+    return map(_record_fields, records)
 
 
 class StreamDefinitionInput(TypedDict, total=False):
@@ -87,7 +151,62 @@ class RoleMember(TypedDict):
     granted_by: str
 
 
-class AttestationMetadata(TypedDict):
+class RoleGrant(TypedDict):
+    owner: str
+    role_name: str
+    wallets: "list[str] | WalletSet"
+
+
+class WalletSet:
+    """A fixed list of wallet addresses, converted to a Go slice once.
+
+    The role methods (grant_role, revoke_role, are_members_of and the batch
+    variants) accept a WalletSet anywhere they take a list of wallets. Scripts
+    that apply many role operations to the same wallets can build one
+    WalletSet and reuse it, instead of converting the list on every call.
+
+    Example::
+
+        writers = WalletSet(["0xabc...", "0xdef..."])
+        client.grant_role("system", "network_writer", writers)
+        client.are_members_of("system", "network_writer", writers)
+    """
+
+    __slots__ = ("wallets", "_go")
+
+    def __init__(self, wallets: "list[str] | tuple[str, ...]"):
+        self.wallets = tuple(wallets)
+        self._go = _Slice_string(list(self.wallets))
+
+    def __len__(self) -> int:
+        return len(self.wallets)
+
+    def __iter__(self):
+        return iter(self.wallets)
+
+    def __repr__(self) -> str:
+        return f"WalletSet({list(self.wallets)!r})"
+
+
+def _go_wallets(wallets: "list[str] | WalletSet") -> Any:
+    """The Go slice for a wallet list, reusing a WalletSet's prebuilt one."""
+    if isinstance(wallets, WalletSet):
+        return wallets._go
+    return _Slice_string(wallets)
+
+
+@dataclass(slots=True)
+class AttestationRecord:
+    """One row of list_attestations.
+
+    Fields are read as attributes. For code written against the dicts
+    list_attestations used to return, the read-only mapping methods are kept:
+    ``record["field"]``, ``"field" in record``, ``record.get(...)``,
+    ``record.keys()`` and therefore ``dict(record)``. A record is not a dict,
+    though: it doesn't compare equal to one and json.dumps needs
+    ``dict(record)`` first.
+    """
+
     request_tx_id: str
     attestation_hash: bytes
     requester: bytes
@@ -95,6 +214,20 @@ class AttestationMetadata(TypedDict):
     signed_height: int | None
     encrypt_sig: bool
 
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.__slots__
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key) if key in self.__slots__ else default
+
+    def keys(self) -> tuple[str, ...]:
+        return self.__slots__
+
 
 class AttestationSignatureVerification(TypedDict):
     """Result of attestation signature verification"""
@@ -104,6 +237,21 @@ class AttestationSignatureVerification(TypedDict):
     signature: bytes  # The 65-byte signature (R || S || V)
 
 
+class AttestationNotReadyError(RuntimeError):
+    """Raised by get_signed_attestation(require_signed=True) while the
+    attestation has not been signed yet. Retrying later may succeed.
+
+    Attributes
+    ----------
+    payload : bytes
+        The unsigned (possibly empty) payload returned so far.
+    """
+
+    def __init__(self, message: str, payload: bytes = b""):
+        super().__init__(message)
+        self.payload = payload
+
+
 class BridgeHistory(TypedDict):
     """Transaction history record from the bridge extension."""
     type: str
@@ -450,6 +598,206 @@ def _normalize_bridge_for_extension(bridge: str) -> str:
     return _EXTENSION_NAMESPACE_ALIASES.get(bridge, bridge)
 
 
+def _require_numpy(feature: str) -> Any:
+    """Import numpy lazily for the columnar readers; it is an optional extra."""
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError(
+            f"{feature} requires numpy; install it with "
+            '`pip install "trufnetwork_sdk_py[numpy]"`'
+        ) from e
+    return numpy
+
+
+def _record_columns(
+        batches: Iterable[tuple[str, list[Record] | list[RecordTuple]]],
+) -> tuple[list[str], array, array, array]:
+    """
+    Flatten (stream_id, records) pairs into the columns expected by
+    NewInsertRecordInputsBulk: the distinct stream ids, a per-record int32
+    index into them, and the int64 dates / float64 values. The numeric
+    columns are typed arrays so each crosses the binding as one byte buffer.
+    """
+    table: dict[str, int] = {}
+    stream_idx = array("i")
+    dates = array("q")
+    values = array("d")
+    add_date = dates.append
+    add_value = values.append
+    for stream_id, records in batches:
+        stream_idx += array("i", [table.setdefault(stream_id, len(table))]) * len(records)
+        for date, value in _record_pairs(records):
+            add_date(date)
+            add_value(value)
+    return list(table), stream_idx, dates, values
+
+
+def _encode_stream_ids(stream_ids: str | list[str], n: int) -> tuple[list[str], array]:
+    """
+    Dictionary-encode a per-record stream id column (or one stream id for
+    all n records) into distinct ids plus an int32 index column.
+    """
+    if isinstance(stream_ids, str):
+        return [stream_ids], array("i", [0]) * n
+    table: dict[str, int] = {}
+    add = table.setdefault
+    stream_idx = array("i", [add(stream_id, len(table)) for stream_id in stream_ids])
+    return list(table), stream_idx
+
+
+def _packed_column(column: Any, typecode: str) -> bytes:
+    """
+    Native-endian bytes of an int64 ("q") / float64 ("d") column, the layout
+    NewInsertRecordInputsBulk expects. array.array and NumPy arrays of the
+    right type are copied once; anything else is packed via array().
+    """
+    if isinstance(column, array) and column.typecode == typecode:
+        return column.tobytes()
+    if hasattr(column, "dtype"):
+        return column.astype("=i8" if typecode == "q" else "=f8", copy=False).tobytes()
+    return array(typecode, column).tobytes()
+
+
+def _reraise_insert_error(e: Exception) -> None:
+    """Re-raise an insert failure, mapping fee estimation errors to ValueError."""
+    if "failed to estimate price" in str(e):
+        raise ValueError(
+            "Request too large: The batch size exceeds the maximum allowed size"
+        ) from e
+    raise e
+
+
+def _record_columns_to_numpy(np: Any, cols: Any) -> tuple[Any, Any]:
+    """View the packed little-endian buffers of a RecordColumns result as
+    int64 dates and float64 values."""
+    dates = np.frombuffer(bytes(cols.Dates), dtype="<i8")
+    values = np.frombuffer(bytes(cols.Values), dtype="<f8")
+    return dates, values
+
+
+def _record_columns_to_tuples(cols: Any) -> list["RecordTuple"]:
+    """Unpack the little-endian buffers of a RecordColumns result into
+    RecordTuple(date, value) rows, without NumPy."""
+    dates = array("q", bytes(cols.Dates))
+    values = array("d", bytes(cols.Values))
+    if sys.byteorder == "big":
+        dates.byteswap()
+        values.byteswap()
+    return list(map(RecordTuple._make, zip(dates, values)))
+
+
+# Sort orders accepted by list_attestations, compared case-insensitively.
+_ORDER_BY_ALLOWED = frozenset({
+    "created_height asc",
+    "created_height desc",
+    "signed_height asc",
+    "signed_height desc",
+})
+
+# Field extractors for the string-valued rows of ListAttestationsJSON and
+# ListTransactionFeesJSON, in unpacking order. Every key is always set by the
+# binding.
+_attestation_row_fields = itemgetter(
+    "RequestTxID",
+    "AttestationHash",
+    "Requester",
+    "CreatedHeight",
+    "SignedHeight",
+    "EncryptSig",
+)
+_fee_row_fields = itemgetter(
+    "TxID",
+    "BlockHeight",
+    "Method",
+    "Caller",
+    "TotalFee",
+    "FeeRecipient",
+    "Metadata",
+    "DistributionSequence",
+    "DistributionRecipient",
+    "DistributionAmount",
+)
+
+
+def _attestation_record(row: dict[str, str]) -> AttestationRecord:
+    """Parse one ListAttestationsJSON row."""
+    (
+        request_tx_id,
+        attestation_hash_hex,
+        requester_hex,
+        created_height_str,
+        signed_height_str,
+        encrypt_sig,
+    ) = _attestation_row_fields(row)
+
+    # Parse signed_height (handle null)
+    signed_height: int | None = None
+    if signed_height_str and signed_height_str != "null":
+        try:
+            signed_height = int(signed_height_str)
+        except ValueError:
+            pass
+
+    # Parse with error handling for malformed data
+    try:
+        attestation_hash = bytes.fromhex(attestation_hash_hex)
+        requester = bytes.fromhex(requester_hex)
+        created_height = int(created_height_str or "0")
+    except (ValueError, TypeError) as e:
+        raise ValueError(
+            f"Failed to parse attestation metadata: {e}. "
+            f"AttestationHash: {attestation_hash_hex}, "
+            f"Requester: {requester_hex}, "
+            f"CreatedHeight: {created_height_str}"
+        ) from e
+
+    return AttestationRecord(
+        request_tx_id,
+        attestation_hash,
+        requester,
+        created_height,
+        signed_height,
+        encrypt_sig == "true",
+    )
+
+
+# Public field names per gopy handle type, resolved once via dir().
+_HANDLE_FIELDS: dict[type, tuple[str, ...]] = {}
+
+
+def _handle_fields(handle_type: type) -> tuple[str, ...]:
+    """
+    Public data attributes of a gopy handle type: dir() minus private/dunder
+    names and the handle bookkeeping members. Cached per type, since dir()
+    walks and sorts the whole MRO on every call.
+    """
+    fields = _HANDLE_FIELDS.get(handle_type)
+    if fields is None:
+        fields = tuple(
+            field
+            for field in dir(handle_type)
+            if not field.startswith("_") and field not in ("handle", "incref", "decref")
+        )
+        _HANDLE_FIELDS[handle_type] = fields
+    return fields
+
+
+def _visibility_from_name(visibility: "int | str") -> int:
+    """
+    Map "public"/"private" to the binding's visibility enum. The enum values
+    themselves (VISIBILITY_PUBLIC / VISIBILITY_PRIVATE) pass through as is.
+    """
+    if type(visibility) is int and visibility in _VISIBILITY_NAMES:
+        return visibility
+    try:
+        return _VISIBILITY_BY_NAME[visibility]
+    except (KeyError, TypeError):
+        raise ValueError(
+            f"visibility must be 'public' or 'private', got {visibility!r}"
+        ) from None
+
+
 def is_binary_action(name: str) -> bool:
     """Returns True if the action name corresponds to a binary action (IDs 6-9)"""
     return ACTION_REGISTRY.get(name, {}).get("is_binary", False)
@@ -608,6 +956,13 @@ class MAAEvent(TypedDict):
 
 
 class TNClient:
+    # Worker pool for wait="async" confirmations, shared by every client in
+    # the process and created on first use.
+    _wait_pool: ClassVar[ThreadPoolExecutor | None] = None
+    _wait_pool_lock: ClassVar[threading.Lock] = threading.Lock()
+    # Signer address, fixed for the life of the client; resolved on first use.
+    _current_account: str | None = None
+
     def __init__(self, url: str, token: str):
         """
         Initialize a new client.
@@ -623,46 +978,14 @@ class TNClient:
             leveraging cached data when available.
         """
         self.client = truf_sdk.NewClient(url, token)
+        # NewGetRecordInput with the client pre-bound, shared by the
+        # get_records / get_index readers.
+        self._new_get_record = partial(_NewGetRecordInput, self.client)
 
     # --------------------------------------------------
     #               Private Helper Methods
     # --------------------------------------------------
 
-    def _coalesce_str(self, val: str | None, default: str = "") -> str:
-        """
-        Helper to coalesce an optional string into a non-empty string.
-        If val is None, return default; otherwise return val.
-        """
-        return val if val is not None else default
-
-    def _coalesce_int(self, val: int | None, default: int = -1) -> int:
-        """
-        Helper to coalesce an optional integer into a sentinel value.
-
-        Args:
-            val: The optional integer value
-            default: The default value to use if val is None (-1 by default)
-
-        Returns:
-            The non-None integer value
-        """
-        return val if val is not None else default
-
-    def _go_slice_of_maps_to_list_of_dicts(self, go_slice: Any) -> list[dict[str, Any]]:
-        """
-        Helper to convert a Go slice of maps into a Python list of dicts.
-
-        Args:
-            go_slice: The Go slice object returned from the bindings
-
-        Returns:
-            A list of Python dictionaries
-        """
-        result = []
-        for record in go_slice:
-            result.append(dict(record.items()))
-        return result
-
     def _records_handle_to_list_of_dicts(self, records: Any) -> list[dict[str, Any]]:
         """
         Specialized helper for `call_procedure` that converts the returned records
@@ -671,24 +994,31 @@ class TNClient:
         if records is None:
             return []
 
-        result = []
         record_dict = {}
-        for field in dir(records):
-            # Skip private/dunder attributes
-            if not field.startswith("_") and field not in (
-                    "handle",
-                    "incref",
-                    "decref",
-            ):
-                try:
-                    value = getattr(records, field)
-                    record_dict[field] = value
-                except AttributeError:
-                    continue
-
-        if record_dict:
-            result.append(record_dict)
-        return result
+        for field in _handle_fields(type(records)):
+            try:
+                record_dict[field] = getattr(records, field)
+            except AttributeError:
+                continue
+
+        return [record_dict] if record_dict else []
+
+    def _new_insert_inputs(
+            self, batches: Iterable[tuple[str, list[Record] | list[RecordTuple]]]
+    ) -> Any:
+        """
+        Build the Go []InsertRecordInput for (stream_id, records) pairs with a
+        single NewInsertRecordInputsBulk call instead of one binding call per
+        record. The data provider is the client's own signer.
+        """
+        stream_ids, stream_idx, dates, values = _record_columns(batches)
+        return _NewInsertRecordInputsBulk(
+            self.client,
+            _Slice_string(stream_ids),
+            _Slice_byte_from_bytes(stream_idx.tobytes()),
+            _Slice_byte_from_bytes(dates.tobytes()),
+            _Slice_byte_from_bytes(values.tobytes()),
+        )
 
     def _map_cache_metadata(self, response) -> CacheMetadata:
         """
@@ -720,50 +1050,40 @@ class TNClient:
             warnings.warn(f"Failed to map cache metadata from Go: {e}", UserWarning)
             return CacheMetadata(hit=False, cache_height=None)
 
-    def _extract_records_data(
-            self, response: truf_sdk.DataResponse
-    ) -> list[StreamRecord]:
-        """Extract and format records data from DataResponse."""
-        data = []
-        for record in response.Data:
-            data.append(
-                StreamRecord(EventTime=str(record.Date), Value=float(record.Value))
-            )
-        return data
-
-    def _extract_single_record_data(
-            self, response: truf_sdk.DataResponse
-    ) -> StreamRecord | None:
-        """Extract and format single record data from SingleRecordResponse."""
-        records = list(response.Data)
-        if len(records) > 0:
-            # warn if it's returning more than one record
-            if len(records) > 1:
-                warnings.warn(
-                    "Returning more than one record, returning the first one. This is a bug, please report it.",
-                    UserWarning,
-                )
-            # return the first record
-            record = records[0]
-            return StreamRecord(EventTime=str(record.Date), Value=float(record.Value))
-        return None
-
-    def _format_records_response(
-            self, response: truf_sdk.DataResponse
+    def _format_records_json(
+            self, raw: str
     ) -> CacheAwareResponse[list[StreamRecord]]:
         """
-        Format DataResponse into cache-aware response for list-based methods (get_records, get_index).
+        Format the JSON-encoded DataResponse from GetRecordsJSON / GetIndexJSON
+        into a cache-aware response for list-based methods (get_records, get_index).
         """
-        cache_metadata = self._map_cache_metadata(response)
-        data = self._extract_records_data(response)
+        payload = _json_loads(raw)
+        data = [
+            StreamRecord(EventTime=str(record["date"]), Value=float(record["value"]))
+            for record in payload["data"] or ()
+        ]
 
-        return CacheAwareResponse(data=data, cache=cache_metadata)
+        hit = payload["cache_hit"]
+        height = payload["height"]
+        cache_height = height["value"] if hit and height["is_set"] else None
+
+        return CacheAwareResponse(
+            data=data, cache=CacheMetadata(hit=hit, cache_height=cache_height)
+        )
+
+    def _extract_single_record_data(
+            self, response: truf_sdk.FirstRecordResult
+    ) -> StreamRecord | None:
+        """Extract and format single record data from FirstRecordResult."""
+        if not response.Found:
+            return None
+        return StreamRecord(EventTime=str(response.Date), Value=response.Value)
 
     def _format_single_record_response(
-            self, response: truf_sdk.DataResponse
+            self, response: truf_sdk.FirstRecordResult
     ) -> CacheAwareResponse[StreamRecord | None]:
         """
-        Format SingleRecordResponse into cache-aware response for single record methods (get_first_record).
+        Format FirstRecordResult into cache-aware response for single record methods (get_first_record).
         """
         cache_metadata = self._map_cache_metadata(response)
         data = self._extract_single_record_data(response)
@@ -780,22 +1100,43 @@ class TNClient:
     #               Public API Methods
     # --------------------------------------------------
 
+    @overload
     def deploy_stream(
             self,
             stream_id: str,
             stream_type: str = truf_sdk.StreamTypePrimitive,
             wait: bool = True,
             allow_zeros: bool = False,
-    ) -> str:
+    ) -> str: ...
+
+    @overload
+    def deploy_stream(
+            self,
+            stream_id: str,
+            stream_type: str = truf_sdk.StreamTypePrimitive,
+            *,
+            wait: Literal["async"],
+            allow_zeros: bool = False,
+    ) -> "Future[str]": ...
+
+    def deploy_stream(
+            self,
+            stream_id: str,
+            stream_type: str = truf_sdk.StreamTypePrimitive,
+            wait: bool | Literal["async"] = True,
+            allow_zeros: bool = False,
+    ) -> "str | Future[str]":
         """
         Deploy a stream with the given stream ID and stream type.
         If wait is True, it will wait for the transaction to be confirmed.
-        Returns the transaction hash.
+        Returns the transaction hash, or with wait="async" a Future resolving
+        to it once the transaction is confirmed.
 
         Parameters:
             stream_id: 32-character stream identifier (use generate_stream_id).
             stream_type: STREAM_TYPE_PRIMITIVE or STREAM_TYPE_COMPOSED.
-            wait: Block until the deploy transaction is confirmed.
+            wait: Block until the deploy transaction is confirmed, or
+                "async" to return a Future instead.
             allow_zeros: Default False (preserves the historical behavior
                 of dropping value=0 inserts). Set True for streams where
                 zero is a meaningful measurement (e.g., a "ships in transit"
@@ -803,9 +1144,7 @@ class TNClient:
                 with `set_allow_zeros`.
         """
         deploy_tx_hash = truf_sdk.DeployStream(self.client, stream_id, stream_type, allow_zeros)
-        if wait:
-            self.wait_for_tx(deploy_tx_hash)
-        return deploy_tx_hash
+        return self._finish_tx(deploy_tx_hash, wait)
 
     def set_allow_zeros(
             self,
@@ -836,13 +1175,27 @@ class TNClient:
         """
         return truf_sdk.GetAllowZeros(self.client, stream_id)
 
+    @overload
     def insert_record(
-            self, stream_id: str, record: dict[str, float | int], wait: bool = True
-    ) -> str:
+            self, stream_id: str, record: dict[str, float | int] | RecordTuple, wait: bool = True
+    ) -> str: ...
+
+    @overload
+    def insert_record(
+            self, stream_id: str, record: dict[str, float | int] | RecordTuple, wait: Literal["async"]
+    ) -> "Future[str]": ...
+
+    def insert_record(
+            self,
+            stream_id: str,
+            record: dict[str, float | int] | RecordTuple,
+            wait: bool | Literal["async"] = True,
+    ) -> "str | Future[str]":
         """
         Insert a single record into a stream with the given stream ID.
         If wait is True, it will wait for the transaction to be confirmed.
-        Returns the transaction hash.
+        Returns the transaction hash. With wait="async" it returns at once a
+        Future resolving to the hash once the transaction is confirmed.
 
         Record is expected to have:
           - "date": int (UNIX timestamp)
@@ -852,55 +1205,69 @@ class TNClient:
             For inserting multiple records rapidly, use `batch_insert_records`
             instead to avoid potential nonce errors.
         """
-        go_input = truf_sdk.NewInsertRecordInput(
-            self.client, stream_id, record["date"], record["value"]
-        )
-        insert_tx_hash = truf_sdk.InsertRecord(self.client, go_input)
-
-        if wait:
-            truf_sdk.WaitForTx(self.client, insert_tx_hash)
+        date, value = record if isinstance(record, tuple) else _record_fields(record)
+        go_input = _NewInsertRecordInput(self.client, stream_id, date, value)
+        insert_tx_hash = _InsertRecord(self.client, go_input)
 
-        return insert_tx_hash
+        return self._finish_tx(insert_tx_hash, wait)
 
+    @overload
     def insert_records(
             self,
             stream_id: str,
-            records: list[dict[str, float | int]],
+            records: list[dict[str, float | int]] | list[RecordTuple],
             wait: bool = True,
-    ) -> str:
+    ) -> str: ...
+
+    @overload
+    def insert_records(
+            self,
+            stream_id: str,
+            records: list[dict[str, float | int]] | list[RecordTuple],
+            wait: Literal["async"],
+    ) -> "Future[str]": ...
+
+    def insert_records(
+            self,
+            stream_id: str,
+            records: list[dict[str, float | int]] | list[RecordTuple],
+            wait: bool | Literal["async"] = True,
+    ) -> "str | Future[str]":
         """
         Insert records into a stream with the given stream ID.
         If wait is True, it will wait for the transaction to be confirmed.
-        Returns the transaction hash.
+        Returns the transaction hash. With wait="async" it returns at once a
+        Future resolving to the hash once the transaction is confirmed.
 
         Each record is expected to have:
           - "date": int (UNIX timestamp)
           - "value": float or int
+        Records may also be given as RecordTuple(date, value); don't mix the
+        two forms in one list.
 
         Note:
             For inserting multiple records rapidly, use `batch_insert_records`
             instead to avoid potential nonce errors.
         """
 
-        input_list = []
-        for _, record in enumerate(records):
-            # Create InsertRecordInput struct
-            go_input = truf_sdk.NewInsertRecordInput(
-                self.client, stream_id, record["date"], record["value"]
-            )
-            input_list.append(go_input)
+        go_input_list = self._new_insert_inputs([(stream_id, records)])
+        insert_tx_hash = _InsertRecords(self.client, go_input_list)
 
-        go_input_list = truf_sdk.Slice_s1_types_InsertRecordInput(input_list)
-        insert_tx_hash = truf_sdk.InsertRecords(self.client, go_input_list)
+        return self._finish_tx(insert_tx_hash, wait)
 
-        if wait:
-            truf_sdk.WaitForTx(self.client, insert_tx_hash)
+    @overload
+    def batch_insert_records(
+            self, batches: list[RecordBatch], wait: bool = True
+    ) -> str: ...
 
-        return insert_tx_hash
+    @overload
+    def batch_insert_records(
+            self, batches: list[RecordBatch], wait: Literal["async"]
+    ) -> "Future[str]": ...
 
     def batch_insert_records(
-            self, batches: list[RecordBatch], wait: bool = True
-    ) -> str:
+            self, batches: list[RecordBatch], wait: bool | Literal["async"] = True
+    ) -> "str | Future[str]":
         """
         Insert multiple batches of records into different streams in a single transaction.
         This is the most efficient way to insert large amounts of data.
@@ -913,7 +1280,8 @@ class TNClient:
 
         Parameters:
             - batches : A list of batch objects.
-            - wait : Whether to wait for the transaction to be confirmed.
+            - wait : Whether to wait for the transaction to be confirmed, or
+              "async" to return a Future resolving to the hash once it is.
 
         Returns:
             A single transaction hash for all inserted records.
@@ -921,37 +1289,108 @@ class TNClient:
         Raises:
             ValueError: If the total batch size is too large for the network to process.
         """
-        all_inputs = []
+        # Collect all records from all batches into one Go slice
+        go_input_list = self._new_insert_inputs(
+            (batch["stream_id"], batch["inputs"]) for batch in batches
+        )
 
-        # Collect all records from all batches into a single list
-        for batch in batches:
-            stream_id = batch["stream_id"]
-            inputs = batch["inputs"]
+        try:
+            insert_tx_hash = _InsertRecords(self.client, go_input_list)
+        except Exception as e:
+            _reraise_insert_error(e)
 
-            for record in inputs:
-                # Create InsertRecordInput struct for each record
-                go_input = truf_sdk.NewInsertRecordInput(
-                    self.client, stream_id, record["date"], record["value"]
-                )
-                all_inputs.append(go_input)
+        return self._finish_tx(insert_tx_hash, wait)
+
+    @overload
+    def batch_insert_records_columnar(
+            self, stream_ids: str | list[str], dates: Any, values: Any, wait: bool = True
+    ) -> str: ...
+
+    @overload
+    def batch_insert_records_columnar(
+            self, stream_ids: str | list[str], dates: Any, values: Any, wait: Literal["async"]
+    ) -> "Future[str]": ...
+
+    def batch_insert_records_columnar(
+            self,
+            stream_ids: str | list[str],
+            dates: Any,
+            values: Any,
+            wait: bool | Literal["async"] = True,
+    ) -> "str | Future[str]":
+        """
+        Insert records given as parallel columns in a single transaction,
+        without building a dict per record.
 
-        # Convert to Go slice and make a single call to InsertRecords
-        go_input_list = truf_sdk.Slice_s1_types_InsertRecordInput(all_inputs)
+        Parameters:
+            - stream_ids : The stream id of each record, or one stream id for all.
+            - dates : UNIX timestamps; a NumPy int64 array, array('q') or any
+              sequence of ints.
+            - values : Record values; a NumPy float64 array, array('d') or any
+              sequence of numbers.
+            - wait : Whether to wait for the transaction to be confirmed, or
+              "async" to return a Future resolving to the hash once it is.
+
+        Returns:
+            A single transaction hash for all inserted records.
+
+        Raises:
+            ValueError: If the columns differ in length, or the batch is too
+                large for the network to process.
+        """
+        table, stream_idx = _encode_stream_ids(stream_ids, len(dates))
+        if not len(stream_idx) == len(dates) == len(values):
+            raise ValueError(
+                f"columns must have equal length, got {len(stream_idx)} stream ids, "
+                f"{len(dates)} dates and {len(values)} values"
+            )
 
         try:
-            insert_tx_hash = truf_sdk.InsertRecords(self.client, go_input_list)
+            insert_tx_hash = _InsertRecordsColumnar(
+                self.client,
+                _Slice_string(table),
+                _Slice_byte_from_bytes(stream_idx.tobytes()),
+                _Slice_byte_from_bytes(_packed_column(dates, "q")),
+                _Slice_byte_from_bytes(_packed_column(values, "d")),
+            )
         except Exception as e:
-            error_str = str(e)
-            if "failed to estimate price" in error_str:
-                raise ValueError(
-                    "Request too large: The batch size exceeds the maximum allowed size"
-                ) from e
-            raise e
+            _reraise_insert_error(e)
 
-        if wait:
-            truf_sdk.WaitForTx(self.client, insert_tx_hash)
+        return self._finish_tx(insert_tx_hash, wait)
+
+    def insert_records_many(
+            self, batches: list[RecordBatch], wait_all: bool = True
+    ) -> list[str]:
+        """
+        Insert several batches of records, one transaction per batch, without
+        blocking on each transaction in turn.
+
+        Every batch is broadcast immediately; if wait_all is True a single
+        barrier then waits for all of the transactions concurrently, so the
+        call costs one confirmation round-trip instead of one per batch.
+
+        Parameters:
+            - batches : A list of RecordBatch objects (stream_id + inputs).
+            - wait_all : Whether to wait for every transaction to be confirmed.
 
-        return insert_tx_hash
+        Returns:
+            The transaction hashes, in batch order.
+
+        Note:
+            Transactions are broadcast sequentially from this client's signer.
+            For thousands of chunks, use `BulkInserter`, which also caches the
+            nonce and retries transient broadcast failures.
+        """
+        client = self.client
+        tx_hashes = []
+        for batch in batches:
+            go_inputs = self._new_insert_inputs([(batch["stream_id"], batch["inputs"])])
+            tx_hashes.append(_InsertRecords(client, go_inputs))
+
+        if wait_all:
+            self.wait_for_txs(tx_hashes)
+
+        return tx_hashes
 
     @overload
     def get_records(
@@ -1009,26 +1448,11 @@ class TNClient:
             A list of dictionaries or CacheAwareResponse, depending on use_cache flag.
             Note: Keys from the Go layer are capitalized (e.g., `EventTime`, `Value`).
         """
-        data_provider = self._coalesce_str(data_provider)
-        date_from = self._coalesce_int(date_from)
-        date_to = self._coalesce_int(date_to)
-        frozen_at = self._coalesce_int(frozen_at)
-        base_date = self._coalesce_int(base_date)
-        prefix = self._coalesce_str(prefix)
-
-        input = truf_sdk.NewGetRecordInput(
-            self.client,
-            stream_id,
-            data_provider,
-            date_from,
-            date_to,
-            frozen_at,
-            base_date,
-            prefix,
-            use_cache,
+        input = self._get_record_input(
+            stream_id, data_provider, date_from, date_to, frozen_at, base_date, prefix, use_cache
         )
-        go_response = truf_sdk.GetRecords(self.client, input)
-        response = self._format_records_response(go_response)
+        raw = _GetRecordsJSON(self.client, input)
+        response = self._format_records_json(raw)
 
         if use_cache is _UNSET:
             warnings.warn(
@@ -1041,12 +1465,150 @@ class TNClient:
         else:
             return response
 
+    def _get_record_input(
+            self,
+            stream_id: str,
+            data_provider: str | None,
+            date_from: int | None,
+            date_to: int | None,
+            frozen_at: int | None,
+            base_date: int | None,
+            prefix: str | None,
+            use_cache: bool | None,
+    ) -> Any:
+        """Build the Go GetRecordInput shared by the record and index readers,
+        mapping unset filters to the binding's "" / -1 sentinels."""
+        return self._new_get_record(
+            stream_id,
+            data_provider or "",
+            -1 if date_from is None else date_from,
+            -1 if date_to is None else date_to,
+            -1 if frozen_at is None else frozen_at,
+            -1 if base_date is None else base_date,
+            prefix or "",
+            use_cache,
+        )
+
+    def get_records_columns(
+            self,
+            stream_id: str,
+            data_provider: str | None = None,
+            date_from: int | None = None,
+            date_to: int | None = None,
+            frozen_at: int | None = None,
+            base_date: int | None = None,
+            prefix: str | None = None,
+            *,
+            use_cache: bool = False,
+    ) -> tuple[Any, Any]:
+        """
+        Get records from a stream as NumPy columns instead of StreamRecord objects.
+
+        Takes the same filters as `get_records`. The Go layer packs the result
+        into two little-endian buffers which are viewed without per-row
+        conversion, so this is the cheapest way to feed large ranges into
+        NumPy/pandas. Requires numpy (pip install "trufnetwork_sdk_py[numpy]").
+
+        Returns:
+            (dates, values): int64 UNIX timestamps and float64 values.
+        """
+        np = _require_numpy("get_records_columns")
+
+        input = self._get_record_input(
+            stream_id, data_provider, date_from, date_to, frozen_at, base_date, prefix, use_cache
+        )
+        return _record_columns_to_numpy(
+            np, truf_sdk.GetRecordsColumnar(self.client, input)
+        )
+
+    def get_index_columns(
+            self,
+            stream_id: str,
+            data_provider: str | None = None,
+            date_from: int | None = None,
+            date_to: int | None = None,
+            frozen_at: int | None = None,
+            base_date: int | None = None,
+            prefix: str | None = None,
+            *,
+            use_cache: bool = False,
+    ) -> tuple[Any, Any]:
+        """
+        Get the rebased index of a stream as NumPy columns instead of
+        StreamRecord objects.
+
+        Takes the same filters as `get_index`. The Go layer packs the result
+        into two little-endian buffers which are viewed without per-row
+        conversion, so this is the cheapest way to feed large ranges into
+        NumPy/pandas. Requires numpy (pip install "trufnetwork_sdk_py[numpy]").
+
+        Returns:
+            (dates, values): int64 UNIX timestamps and float64 index values.
+        """
+        np = _require_numpy("get_index_columns")
+
+        input = self._get_record_input(
+            stream_id, data_provider, date_from, date_to, frozen_at, base_date, prefix, use_cache
+        )
+        return _record_columns_to_numpy(
+            np, truf_sdk.GetIndexColumnar(self.client, input)
+        )
+
+    def get_records_tuples(
+            self,
+            stream_id: str,
+            data_provider: str | None = None,
+            date_from: int | None = None,
+            date_to: int | None = None,
+            frozen_at: int | None = None,
+            base_date: int | None = None,
+            prefix: str | None = None,
+            *,
+            use_cache: bool = False,
+    ) -> list[RecordTuple]:
+        """
+        Get records from a stream as RecordTuple(date, value) rows instead of
+        StreamRecord objects.
+
+        Takes the same filters as `get_records`. Rows are unpacked from the
+        same packed buffers as `get_records_columns`, skipping the per-row
+        model validation, and dates are ints rather than strings. Doesn't
+        require numpy.
+        """
+        input = self._get_record_input(
+            stream_id, data_provider, date_from, date_to, frozen_at, base_date, prefix, use_cache
+        )
+        return _record_columns_to_tuples(truf_sdk.GetRecordsColumnar(self.client, input))
+
+    def get_index_tuples(
+            self,
+            stream_id: str,
+            data_provider: str | None = None,
+            date_from: int | None = None,
+            date_to: int | None = None,
+            frozen_at: int | None = None,
+            base_date: int | None = None,
+            prefix: str | None = None,
+            *,
+            use_cache: bool = False,
+    ) -> list[RecordTuple]:
+        """
+        Get the rebased index of a stream as RecordTuple(date, value) rows
+        instead of StreamRecord objects.
+
+        Takes the same filters as `get_index`; see `get_records_tuples`.
+        """
+        input = self._get_record_input(
+            stream_id, data_provider, date_from, date_to, frozen_at, base_date, prefix, use_cache
+        )
+        return _record_columns_to_tuples(truf_sdk.GetIndexColumnar(self.client, input))
+
     def get_type(self, stream_id: str, data_provider: str | None = None) -> str:
         """
         Get the type of a stream with the given stream ID.
         Returns the type of the stream.
         """
-        data_provider = self._coalesce_str(data_provider)
+        data_provider = data_provider or ""
         return truf_sdk.GetType(self.client, stream_id, data_provider)
 
     def wait_for_tx(self, tx_hash: str) -> None:
@@ -1057,7 +1619,48 @@ class TNClient:
             Exception: If the transaction fails to execute on-chain (e.g., due to
                        a permission error, invalid input, or other logic error).
         """
-        truf_sdk.WaitForTx(self.client, tx_hash)
+        _WaitForTx(self.client, tx_hash)
+
+    def wait_for_tx_async(self, tx_hash: str) -> "Future[str]":
+        """
+        Wait for a transaction to be confirmed on a background thread.
+
+        Returns:
+            A Future resolving to tx_hash once the transaction is confirmed,
+            or raising the wait_for_tx error if it fails.
+        """
+        pool = TNClient._wait_pool
+        if pool is None:
+            with TNClient._wait_pool_lock:
+                pool = TNClient._wait_pool
+                if pool is None:
+                    pool = TNClient._wait_pool = ThreadPoolExecutor(
+                        max_workers=16, thread_name_prefix="tn-wait"
+                    )
+        return pool.submit(self._wait_and_return, tx_hash)
+
+    def _wait_and_return(self, tx_hash: str) -> str:
+        _WaitForTx(self.client, tx_hash)
+        return tx_hash
+
+    def _finish_tx(self, tx_hash: str, wait: "bool | Literal['async']") -> "str | Future[str]":
+        """Apply a submit method's wait mode to a freshly broadcast tx."""
+        if wait == "async":
+            return self.wait_for_tx_async(tx_hash)
+        if wait:
+            _WaitForTx(self.client, tx_hash)
+        return tx_hash
+
+    def wait_for_txs(self, tx_hashes: list[str]) -> None:
+        """
+        Wait for several transactions to be confirmed, concurrently.
+
+        Raises:
+            Exception: If any transaction fails; the error names the first
+                       failing hash in list order.
+        """
+        if tx_hashes:
+            _WaitForTxs(self.client, _Slice_string(tx_hashes))
 
     def get_current_account(self) -> str:
         """
@@ -1066,18 +1669,27 @@ class TNClient:
         Returns:
             str: The hex-encoded address of the current account
         """
-        return truf_sdk.GetCurrentAccount(self.client)
+        if not self._current_account:
+            self._current_account = truf_sdk.GetCurrentAccount(self.client)
+        return self._current_account
 
-    def destroy_stream(self, stream_id: str, wait: bool = True) -> str:
+    @overload
+    def destroy_stream(self, stream_id: str, wait: bool = True) -> str: ...
+
+    @overload
+    def destroy_stream(self, stream_id: str, wait: Literal["async"]) -> "Future[str]": ...
+
+    def destroy_stream(
+            self, stream_id: str, wait: bool | Literal["async"] = True
+    ) -> "str | Future[str]":
         """
         Destroy a stream with the given stream ID.
         If wait is True, it will wait for the transaction to be confirmed.
-        Returns the transaction hash.
+        Returns the transaction hash, or with wait="async" a Future resolving
+        to it once the transaction is confirmed.
         """
         destroy_tx_hash = truf_sdk.DestroyStream(self.client, stream_id)
-        if wait:
-            truf_sdk.WaitForTx(self.client, destroy_tx_hash)
-        return destroy_tx_hash
+        return self._finish_tx(destroy_tx_hash, wait)
 
     @overload
     def get_first_record(
@@ -1109,14 +1721,14 @@ class TNClient:
             use_cache: bool | None = _UNSET,
     ) -> StreamRecord | None | CacheAwareResponse[StreamRecord | None]:
         """Get the first record of a stream after a given date."""
-        data_provider = self._coalesce_str(data_provider)
-        after_date = self._coalesce_int(after_date)
-        frozen_at = self._coalesce_int(frozen_at)
+        data_provider = data_provider or ""
+        after_date = -1 if after_date is None else after_date
+        frozen_at = -1 if frozen_at is None else frozen_at
 
         input = truf_sdk.NewGetFirstRecordInput(
             self.client, stream_id, data_provider, after_date, frozen_at, use_cache
         )
-        go_response = truf_sdk.GetFirstRecord(self.client, input)
+        go_response = truf_sdk.GetFirstRecordTyped(self.client, input)
         response = self._format_single_record_response(go_response)
 
         if use_cache is _UNSET:
@@ -1169,26 +1781,11 @@ class TNClient:
             use_cache: bool | None = _UNSET,
     ) -> list[StreamRecord] | CacheAwareResponse[list[StreamRecord]]:
         """Get index from a stream with the given stream ID."""
-        data_provider = self._coalesce_str(data_provider)
-        date_from = self._coalesce_int(date_from)
-        date_to = self._coalesce_int(date_to)
-        frozen_at = self._coalesce_int(frozen_at)
-        base_date = self._coalesce_int(base_date)
-        prefix = self._coalesce_str(prefix)
-
-        input = truf_sdk.NewGetRecordInput(
-            self.client,
-            stream_id,
-            data_provider,
-            date_from,
-            date_to,
-            frozen_at,
-            base_date,
-            prefix,
-            use_cache,
+        input = self._get_record_input(
+            stream_id, data_provider, date_from, date_to, frozen_at, base_date, prefix, use_cache
         )
-        go_response = truf_sdk.GetIndex(self.client, input)
-        response = self._format_records_response(go_response)
+        raw = _GetIndexJSON(self.client, input)
+        response = self._format_records_json(raw)
 
         if use_cache is _UNSET:
             warnings.warn(
@@ -1212,17 +1809,17 @@ class TNClient:
         """
         List all streams associated with client account
         """
-        limit = self._coalesce_int(limit)
-        offset = self._coalesce_int(offset)
-        data_provider = self._coalesce_str(data_provider)
-        order_by = self._coalesce_str(order_by)
+        limit = -1 if limit is None else limit
+        offset = -1 if offset is None else offset
+        data_provider = data_provider or ""
+        order_by = order_by or ""
 
         input = truf_sdk.NewListStreamsInput(
             limit, offset, data_provider, order_by, block_height
         )
-        go_slice_of_maps = truf_sdk.ListStreams(self.client, input)
-
-        return self._go_slice_of_maps_to_list_of_dicts(go_slice_of_maps)
+        # The rows come back as one JSON array of string-valued objects,
+        # decoded at once instead of reading each Go map key by key.
+        return _json_loads(truf_sdk.ListStreamsJSON(self.client, input))
 
     def set_taxonomy(
             self,
@@ -1243,27 +1840,25 @@ class TNClient:
             - group_sequence: Optional integer for ordering taxonomies.
             - wait: If True, waits for the transaction to be confirmed.
         """
-        start_date = self._coalesce_int(start_date)
-
-        taxonomy_items = []
-        for taxonomy in taxonomies:
-            data_provider = self._coalesce_str(taxonomy.stream.get("data_provider"))
-            taxonomy_item = truf_sdk.NewTaxonomyItemInput(
-                self.client,
-                data_provider,
-                taxonomy.stream["stream_id"],
-                taxonomy.weight,
-            )
-            taxonomy_items.append(taxonomy_item)
-
-        taxonomy_items_go = truf_sdk.Slice_s1_types_TaxonomyItem(taxonomy_items)
+        start_date = -1 if start_date is None else start_date
+
+        client = self.client
+        # Child streams go to Go as parallel columns, one binding call in all.
+        taxonomy_items_go = truf_sdk.NewTaxonomyItemsColumnar(
+            client,
+            _Slice_string([taxonomy.stream["stream_id"] for taxonomy in taxonomies]),
+            _Slice_string(
+                [taxonomy.stream.get("data_provider") or "" for taxonomy in taxonomies]
+            ),
+            _Slice_float64([float(taxonomy.weight) for taxonomy in taxonomies]),
+        )
         input = truf_sdk.NewTaxonomyInput(
-            self.client, stream_id, taxonomy_items_go, start_date, 0
+            client, stream_id, taxonomy_items_go, start_date, 0
         )
-        tx_hash = truf_sdk.SetTaxonomy(self.client, input)
+        tx_hash = truf_sdk.SetTaxonomy(client, input)
 
         if wait:
-            truf_sdk.WaitForTx(self.client, tx_hash)
+            _WaitForTx(client, tx_hash)
 
         return tx_hash
 
@@ -1286,19 +1881,21 @@ class TNClient:
             return None
 
         child_streams_json = taxonomy_data.get("child_streams")
-        raw_taxonomy_list = json.loads(child_streams_json) if child_streams_json else []
-
-        processed_taxonomies = []
-        for item in raw_taxonomy_list:
-            processed_taxonomies.append(
-                TaxonomyDefinition(
-                    stream={
-                        "stream_id": item.get("stream_id"),
-                        "data_provider": item.get("data_provider"),
-                    },
-                    weight=float(item["weight"]),
-                )
+        raw_taxonomy_list = _json_loads(child_streams_json) if child_streams_json else []
+
+        # The fields are already normalised here, so skip pydantic validation
+        # (model_construct), which dominates for wide composed streams.
+        construct = TaxonomyDefinition.model_construct
+        processed_taxonomies = [
+            construct(
+                stream={
+                    "stream_id": item.get("stream_id"),
+                    "data_provider": item.get("data_provider"),
+                },
+                weight=float(item["weight"]),
             )
+            for item in raw_taxonomy_list
+        ]
 
         return TaxonomyDetails(
             stream_id=taxonomy_data.get("stream_id") or "",
@@ -1377,7 +1974,7 @@ class TNClient:
         return tx_hash
 
     def set_read_visibility(
-            self, stream_id: str, visibilityVal: str, wait: bool = True
+            self, stream_id: str, visibilityVal: int | str, wait: bool = True
     ) -> str:
         """
         Sets the read visibility of the stream -- Private or Public
@@ -1387,11 +1984,12 @@ class TNClient:
 
         Parameters:
             - stream_id : str
-            - visibility : str ("public" or "private")
+            - visibility : str ("public" or "private") or VISIBILITY_PUBLIC / VISIBILITY_PRIVATE
+
+        Raises:
+            ValueError: If visibility is not "public" or "private".
         """
-        visibility = 0
-        if visibilityVal == "private":
-            visibility = 1
+        visibility = _visibility_from_name(visibilityVal)
 
         input = truf_sdk.NewVisibilityInput(self.client, stream_id, visibility)
         tx_hash = truf_sdk.SetReadVisibility(self.client, input)
@@ -1408,7 +2006,7 @@ class TNClient:
 
         visibility = truf_sdk.GetReadVisibility(self.client, stream_id)
 
-        return "public" if visibility == truf_sdk.VisibilityPublic else "private"
+        return _VISIBILITY_NAMES.get(visibility, "private")
 
     def set_compose_visibility(
             self, stream_id: str, visibilityVal: int | str, wait: bool = True
@@ -1421,12 +2019,13 @@ class TNClient:
 
         Parameters:
             - stream_id : str
-            - visibility : str ("public" or "private")
+            - visibility : str ("public" or "private") or VISIBILITY_PUBLIC / VISIBILITY_PRIVATE
+
+        Raises:
+            ValueError: If visibility is not "public" or "private".
         """
 
-        visibility = 0
-        if visibilityVal == "private":
-            visibility = 1
+        visibility = _visibility_from_name(visibilityVal)
 
         input = truf_sdk.NewVisibilityInput(self.client, stream_id, visibility)
         tx_hash = truf_sdk.SetComposeVisibility(self.client, input)
@@ -1443,7 +2042,7 @@ class TNClient:
 
         visibility = truf_sdk.GetComposeVisibility(self.client, stream_id)
 
-        return "public" if visibility == truf_sdk.VisibilityPublic else "private"
+        return _VISIBILITY_NAMES.get(visibility, "private")
 
     def get_allowed_read_wallets(self, stream_id: str) -> list[str]:
         """
@@ -1461,27 +2060,37 @@ class TNClient:
         streams = truf_sdk.GetAllowedComposeStreams(self.client, stream_id)
         return list(streams)
 
+    @overload
+    def batch_deploy_streams(
+            self, definitions: list[StreamDefinitionInput], wait: bool = True
+    ) -> str: ...
+
+    @overload
+    def batch_deploy_streams(
+            self, definitions: list[StreamDefinitionInput], wait: Literal["async"]
+    ) -> "Future[str]": ...
+
     def batch_deploy_streams(
             self,
             definitions: list[StreamDefinitionInput],
-            wait: bool = True,
-    ) -> str:
+            wait: bool | Literal["async"] = True,
+    ) -> "str | Future[str]":
         """
         Deploy multiple streams (primitive and composed).
         Each definition should be a dictionary containing:
             - stream_id: str
             - stream_type: str ("primitive" or "composed")
+            - allow_zeros: bool (optional, default False)
 
         If wait is True, it will wait for the transaction to be confirmed.
-        Returns the transaction hash of the batch operation.
-        """
-        # Build a list of Go StreamDefinition objects.
-        # allow_zeros defaults to False (today's drop-zeros behavior).
-        # The TypedDict declares allow_zeros: bool, but TypedDicts are not
-        # enforced at runtime — Python's bool("false") returns True, so a
-        # plain bool() coercion would silently invert the user's intent.
-        # Reject non-bool values up front to surface the bug instead.
-        go_definitions = []
+        Returns the transaction hash of the batch operation, or with
+        wait="async" a Future resolving to it once the transaction is confirmed.
+        """
+        # TypedDicts aren't enforced at runtime and bool("false") is True, so
+        # reject non-bool allow_zeros rather than coercing it.
+        stream_ids = []
+        stream_types = []
+        allow_zeros_flags = []
         for idx, def_input in enumerate(definitions):
             allow_zeros = def_input.get("allow_zeros", False)
             if not isinstance(allow_zeros, bool):
@@ -1489,20 +2098,19 @@ class TNClient:
                     f"definitions[{idx}].allow_zeros must be bool, "
                     f"got {type(allow_zeros).__name__}={allow_zeros!r}"
                 )
-            go_def = truf_sdk.NewStreamDefinitionForBinding(
-                def_input["stream_id"],
-                def_input["stream_type"],
-                allow_zeros,
-            )
-            go_definitions.append(go_def)
-
-        # Convert to Go slice type
-        final_go_definitions = truf_sdk.Slice_s1_types_StreamDefinition(go_definitions)
+            stream_ids.append(def_input["stream_id"])
+            stream_types.append(def_input["stream_type"])
+            allow_zeros_flags.append(allow_zeros)
 
-        tx_hash = truf_sdk.BatchDeployStreams(self.client, final_go_definitions)
-        if wait:
-            truf_sdk.WaitForTx(self.client, tx_hash)
-        return tx_hash
+        # Binding contract: parallel id/type/allow_zeros columns, built into
+        # []StreamDefinition and deployed on the Go side in one call.
+        tx_hash = truf_sdk.BatchDeployStreamsColumnar(
+            self.client,
+            _Slice_string(stream_ids),
+            _Slice_string(stream_types),
+            _Slice_bool(allow_zeros_flags),
+        )
+        return self._finish_tx(tx_hash, wait)
 
     def batch_stream_exists(
             self,
@@ -1514,34 +2122,17 @@ class TNClient:
             - stream_id: str
             - data_provider: str (hex string)
 
-        Returns a list of results, each indicating if a stream exists.
+        Returns a list of results, each indicating if a stream exists. An
+        empty locators list returns [] without querying the node.
         """
-        py_list_of_go_locators = []
-        for loc_input in locators:
-            go_loc_handle = truf_sdk.NewStreamLocatorForBinding(
-                loc_input["stream_id"], loc_input["data_provider"]
-            )
-            py_list_of_go_locators.append(go_loc_handle)
-
-        final_go_locators = truf_sdk.Slice_s1_types_StreamLocator(
-            py_list_of_go_locators
+        if not locators:
+            return []
+        stream_ids, data_providers = self._locator_columns(locators)
+        # The binding returns the results already in StreamExistsResult shape.
+        return _json_loads(
+            _BatchStreamExistsJSON(self.client, stream_ids, data_providers)
         )
 
-        go_results = truf_sdk.BatchStreamExists(self.client, final_go_locators)
-
-        results = []
-        for go_map in go_results:
-            item = dict(go_map.items())  # Convert Go map to Python dict
-            results.append(
-                {
-                    "stream_id": item["stream_id"],
-                    "data_provider": item["data_provider"],
-                    "exists": item["exists"].lower()
-                              == "true",  # Convert string "true"/"false" to bool
-                }
-            )
-        return results
-
     def batch_filter_streams_by_existence(
             self,
             locators: list[StreamLocatorInput],
@@ -1559,33 +2150,27 @@ class TNClient:
             - locators: List of stream locators to filter.
             - return_existing: bool - If True, returns streams that exist. If False, returns streams that do not exist.
 
-        Returns a list of stream locators that match the filter criteria.
+        Returns a list of stream locators that match the filter criteria. An
+        empty locators list returns [] without querying the node.
         """
-        py_list_of_go_locators = []
-        for loc_input in locators:
-            go_loc_handle = truf_sdk.NewStreamLocatorForBinding(
-                loc_input["stream_id"], loc_input["data_provider"]
+        if not locators:
+            return []
+        stream_ids, data_providers = self._locator_columns(locators)
+        # The binding returns the locators already in StreamLocatorInput shape.
+        return _json_loads(
+            truf_sdk.BatchFilterStreamsByExistenceJSON(
+                self.client, stream_ids, data_providers, return_existing
             )
-            py_list_of_go_locators.append(go_loc_handle)
-
-        final_go_locators = truf_sdk.Slice_s1_types_StreamLocator(
-            py_list_of_go_locators
-        )
-
-        go_results = truf_sdk.BatchFilterStreamsByExistence(
-            self.client, final_go_locators, return_existing
         )
 
-        results = []
-        for go_map in go_results:
-            item = dict(go_map.items())  # Convert Go map to Python dict
-            results.append(
-                {
-                    "stream_id": item["stream_id"],
-                    "data_provider": item["data_provider"],
-                }
-            )
-        return results
+    @staticmethod
+    def _locator_columns(locators: list[StreamLocatorInput]) -> tuple[Any, Any]:
+        """Split locator dicts into the parallel Go string slices the columnar
+        batch bindings expect. A missing data_provider resolves to the
+        client's own address on the Go side."""
+        stream_ids = [loc["stream_id"] for loc in locators]
+        data_providers = [loc.get("data_provider") or "" for loc in locators]
+        return _Slice_string(stream_ids), _Slice_string(data_providers)
 
     def call_procedure(self, procedure: str, args: list[str | None]) -> dict[str, Any]:
         """Call a **read-only** stored procedure on the gateway.
@@ -1607,21 +2192,39 @@ class TNClient:
         """
         # Convert Python list to Go slice wrapper
         str_args = ["" if a is None else str(a) for a in args]
-        go_slice = go.Slice_string(str_args)
-        result_json = truf_sdk.CallProcedureStrings(self.client, procedure, go_slice)
-        return json.loads(result_json)
+        go_slice = _Slice_string(str_args)
+        result_json = _CallProcedureStrings(self.client, procedure, go_slice)
+        return _json_loads(result_json)
 
     # --------------------------------------------------
     #               Role Management Methods
     # --------------------------------------------------
 
+    @overload
     def grant_role(
             self,
             owner: str,
             role_name: str,
-            wallets: list[str],
+            wallets: "list[str] | WalletSet",
             wait: bool = True,
-    ) -> str:
+    ) -> str: ...
+
+    @overload
+    def grant_role(
+            self,
+            owner: str,
+            role_name: str,
+            wallets: "list[str] | WalletSet",
+            wait: Literal["async"],
+    ) -> "Future[str]": ...
+
+    def grant_role(
+            self,
+            owner: str,
+            role_name: str,
+            wallets: "list[str] | WalletSet",
+            wait: bool | Literal["async"] = True,
+    ) -> "str | Future[str]":
         """
         Grants a role to a list of wallets.
 
@@ -1631,27 +2234,43 @@ class TNClient:
         Parameters:
             - owner: The owner of the role (e.g., 'system' or an Ethereum address).
             - role_name: The name of the role.
-            - wallets: A list of wallet addresses to grant the role to.
-            - wait: If True, waits for the transaction to be confirmed.
+            - wallets: A list of wallet addresses (or a WalletSet) to grant the role to.
+            - wait: If True, waits for the transaction to be confirmed; "async"
+              returns a Future resolving to the hash once it is.
 
         Returns:
             The transaction hash.
         """
-        go_wallets = go.Slice_string(wallets)
+        go_wallets = _go_wallets(wallets)
         tx_hash = truf_sdk.GrantRole(self.client, owner, role_name, go_wallets)
 
-        if wait:
-            self.wait_for_tx(tx_hash)
-
-        return tx_hash
+        return self._finish_tx(tx_hash, wait)
 
+    @overload
     def revoke_role(
             self,
             owner: str,
             role_name: str,
-            wallets: list[str],
+            wallets: "list[str] | WalletSet",
             wait: bool = True,
-    ) -> str:
+    ) -> str: ...
+
+    @overload
+    def revoke_role(
+            self,
+            owner: str,
+            role_name: str,
+            wallets: "list[str] | WalletSet",
+            wait: Literal["async"],
+    ) -> "Future[str]": ...
+
+    def revoke_role(
+            self,
+            owner: str,
+            role_name: str,
+            wallets: "list[str] | WalletSet",
+            wait: bool | Literal["async"] = True,
+    ) -> "str | Future[str]":
         """
         Revokes a role from a list of wallets.
 
@@ -1661,25 +2280,68 @@ class TNClient:
         Parameters:
             - owner: The owner of the role.
             - role_name: The name of the role.
-            - wallets: A list of wallet addresses to revoke the role from.
-            - wait: If True, waits for the transaction to be confirmed.
+            - wallets: A list of wallet addresses (or a WalletSet) to revoke the role from.
+            - wait: If True, waits for the transaction to be confirmed; "async"
+              returns a Future resolving to the hash once it is.
 
         Returns:
             The transaction hash.
         """
-        go_wallets = go.Slice_string(wallets)
+        go_wallets = _go_wallets(wallets)
         tx_hash = truf_sdk.RevokeRole(self.client, owner, role_name, go_wallets)
 
+        return self._finish_tx(tx_hash, wait)
+
+    def grant_roles_batch(
+            self, grants: list[RoleGrant], wait: bool = True
+    ) -> list[str]:
+        """
+        Grant several roles, one transaction per grant, without blocking on
+        each transaction in turn.
+
+        Every grant is broadcast immediately; if wait is True a single
+        barrier then waits for all of the transactions concurrently.
+
+        Parameters:
+            - grants: A list of RoleGrant objects (owner, role_name, wallets).
+            - wait: If True, waits for every transaction to be confirmed.
+
+        Returns:
+            The transaction hashes, in grant order.
+        """
+        return self._submit_role_changes(truf_sdk.GrantRole, grants, wait)
+
+    def revoke_roles_batch(
+            self, revocations: list[RoleGrant], wait: bool = True
+    ) -> list[str]:
+        """
+        Revoke several roles, one transaction per revocation, and wait for
+        them together. See `grant_roles_batch`.
+
+        Returns:
+            The transaction hashes, in revocation order.
+        """
+        return self._submit_role_changes(truf_sdk.RevokeRole, revocations, wait)
+
+    def _submit_role_changes(
+            self, submit: Any, changes: list[RoleGrant], wait: bool
+    ) -> list[str]:
+        client = self.client
+        tx_hashes = [
+            submit(client, change["owner"], change["role_name"], _go_wallets(change["wallets"]))
+            for change in changes
+        ]
+
         if wait:
-            self.wait_for_tx(tx_hash)
+            self.wait_for_txs(tx_hashes)
 
-        return tx_hash
+        return tx_hashes
 
     def are_members_of(
             self,
             owner: str,
             role_name: str,
-            wallets: list[str],
+            wallets: "list[str] | WalletSet",
     ) -> list[RoleMembershipStatus]:
         """
         Checks if a list of wallets are members of a specific role.
@@ -1689,29 +2351,20 @@ class TNClient:
         Parameters:
             - owner: The owner of the role.
             - role_name: The name of the role.
-            - wallets: A list of wallet addresses to check.
+            - wallets: A list of wallet addresses (or a WalletSet) to check.
 
         Returns:
             A list of objects, each representing the membership status of a wallet.
+            An empty wallets list returns [] without querying the node.
         """
-        go_wallets = go.Slice_string(wallets)
-        go_results = truf_sdk.AreMembersOf(self.client, owner, role_name, go_wallets)
-
-        results: list[RoleMembershipStatus] = []
-        for go_map in go_results:
-            item = dict(go_map.items())
-            # The keys from Go are capitalized struct fields: `Wallet`, `IsMember`.
-            # We map them to snake_case Python dict keys and correct types.
-            wallet_address = item.get("Wallet", "")
-            is_member_str = str(item.get("IsMember", "false")).lower()
-
-            results.append(
-                {
-                    "wallet": wallet_address,
-                    "is_member": is_member_str == "true",
-                }
-            )
-        return results
+        if not wallets:
+            return []
+        go_wallets = _go_wallets(wallets)
+        # The binding returns the statuses already in RoleMembershipStatus
+        # shape, with is_member as a JSON boolean.
+        return _json_loads(
+            _AreMembersOfJSON(self.client, owner, role_name, go_wallets)
+        )
 
     def list_role_members(
             self,
@@ -1733,38 +2386,19 @@ class TNClient:
             A list of RoleMember dictionaries.
         """
         # Coalesce optional ints into sentinel values expected by the Go layer.
-        limit_val = self._coalesce_int(limit, 0) if limit is not None else 0
-        offset_val = self._coalesce_int(offset, 0)
-
-        go_results = truf_sdk.ListRoleMembers(
-            self.client,
-            owner,
-            role_name,
-            limit_val,
-            offset_val,
-        )
+        limit_val = 0 if limit is None else limit
+        offset_val = 0 if offset is None else offset
 
-        members: list[RoleMember] = []
-        for go_map in go_results:
-            item = dict(go_map.items())
-            wallet = item.get("Wallet", "")
-            granted_at_str = item.get("GrantedAt", "0")
-            granted_by = item.get("GrantedBy", "")
-
-            try:
-                granted_at = int(granted_at_str)
-            except ValueError:
-                granted_at = 0
-
-            members.append(
-                {
-                    "wallet": wallet,
-                    "granted_at": granted_at,
-                    "granted_by": granted_by,
-                }
+        # The binding returns the members already in RoleMember shape.
+        return _json_loads(
+            truf_sdk.ListRoleMembersJSON(
+                self.client,
+                owner,
+                role_name,
+                limit_val,
+                offset_val,
             )
-
-        return members
+        )
 
     # ==========================================
     #          ATTESTATION METHODS
@@ -1804,32 +2438,11 @@ class TNClient:
             ...     max_fee="100000000000000000000",
             ... )
         """
-        # Validate inputs
-        if len(data_provider) != 42:
-            raise ValueError(
-                f"data_provider must be 42 characters (0x + 40 hex), got {len(data_provider)}"
-            )
-
-        if not data_provider.startswith("0x"):
-            raise ValueError("data_provider must start with '0x'")
-
-        if len(stream_id) != 32:
-            raise ValueError(f"stream_id must be 32 characters, got {len(stream_id)}")
-
-        if not action_name:
-            raise ValueError("action_name cannot be empty")
-
-        if encrypt_sig:
-            raise ValueError(
-                "Signature encryption is not supported in MVP (encrypt_sig must be False)"
-            )
-
-        # Validate max_fee is a valid non-negative numeric string
-        if max_fee:
-            if not max_fee.isdigit():
-                raise ValueError(f"max_fee must be a numeric string, got: {max_fee}")
-            if int(max_fee) < 0:
-                raise ValueError(f"max_fee must be non-negative, got {max_fee}")
+        ok, err = self._validate_request_attestation(
+            data_provider, stream_id, action_name, encrypt_sig, max_fee
+        )
+        if not ok:
+            raise ValueError(err)
 
         # Convert args to JSON string for passing to Go layer
         args_json = json.dumps(args)
@@ -1850,20 +2463,64 @@ class TNClient:
 
         return request_tx_id
 
-    def get_signed_attestation(self, request_tx_id: str) -> bytes:
+    @staticmethod
+    def _validate_request_attestation(
+            data_provider: str,
+            stream_id: str,
+            action_name: str,
+            encrypt_sig: bool = False,
+            max_fee: str = "100000000000000000000",
+    ) -> tuple[bool, str | None]:
+        """
+        Check request_attestation inputs without raising.
+
+        Returns (True, None) when valid, otherwise (False, message); the public
+        method raises the message as a ValueError.
+        """
+        if len(data_provider) != 42:
+            return False, f"data_provider must be 42 characters (0x + 40 hex), got {len(data_provider)}"
+
+        if not data_provider.startswith("0x"):
+            return False, "data_provider must start with '0x'"
+
+        if len(stream_id) != 32:
+            return False, f"stream_id must be 32 characters, got {len(stream_id)}"
+
+        if not action_name:
+            return False, "action_name cannot be empty"
+
+        if encrypt_sig:
+            return False, "Signature encryption is not supported in MVP (encrypt_sig must be False)"
+
+        # max_fee must be a valid non-negative numeric string
+        if max_fee:
+            if not max_fee.isdigit():
+                return False, f"max_fee must be a numeric string, got: {max_fee}"
+            if int(max_fee) < 0:
+                return False, f"max_fee must be non-negative, got {max_fee}"
+
+        return True, None
+
+    def get_signed_attestation(self, request_tx_id: str, require_signed: bool = False) -> bytes:
         """
         Retrieve the signed attestation payload.
 
         Args:
             request_tx_id: Transaction ID from request_attestation
+            require_signed: If True, raise AttestationNotReadyError instead of
+                returning a payload that doesn't carry a signature yet
 
         Returns:
             Signed attestation payload (bytes)
 
+        Raises:
+            AttestationNotReadyError: If require_signed is set and the
+                attestation has not been signed yet
+
         Note:
             This may return an empty or incomplete payload if the attestation
             has not been signed by the validator yet. Poll this endpoint
-            until you receive a non-empty payload.
+            until you receive a payload longer than SIGNATURE_OVERHEAD bytes.
 
         Example:
             >>> payload = client.get_signed_attestation(request_tx_id)
@@ -1875,10 +2532,14 @@ class TNClient:
         go_payload = truf_sdk.GetSignedAttestation(self.client, request_tx_id)
 
         # Convert Go bytes to Python bytes
-        if hasattr(go_payload, "__iter__"):
-            return bytes(go_payload)
+        payload = bytes(go_payload) if hasattr(go_payload, "__iter__") else go_payload
+
+        if require_signed and len(payload or b"") <= SIGNATURE_OVERHEAD:
+            raise AttestationNotReadyError(
+                f"Attestation {request_tx_id} is not signed yet", payload or b""
+            )
 
-        return go_payload
+        return payload
 
     def list_attestations(
             self,
@@ -1886,7 +2547,7 @@ class TNClient:
             limit: int | None = None,
             offset: int | None = None,
             order_by: str | None = None,
-    ) -> list[AttestationMetadata]:
+    ) -> list[AttestationRecord]:
         """
         List attestation metadata with optional filtering.
 
@@ -1901,7 +2562,7 @@ class TNClient:
                 - "signed_height desc"
 
         Returns:
-            List of attestation metadata
+            List of AttestationRecord, one per attestation
 
         Example:
             >>> # Get my recent attestations
@@ -1912,94 +2573,63 @@ class TNClient:
             ...     order_by="created_height desc",
             ... )
             >>> for att in attestations:
-            ...     print(f"TX: {att['request_tx_id']}, Height: {att['created_height']}")
+            ...     print(f"TX: {att.request_tx_id}, Height: {att.created_height}")
         """
-        # Validate inputs
-        if requester is not None and len(requester) > 20:
-            raise ValueError(f"requester must be at most 20 bytes, got {len(requester)}")
-
-        if limit is not None and (limit <= 0 or limit > 5000):
-            raise ValueError(f"limit must be between 1 and 5000, got {limit}")
-
-        if offset is not None and offset < 0:
-            raise ValueError(f"offset must be non-negative, got {offset}")
-
-        # Validate order_by
-        valid_order_by = [
-            "created_height asc",
-            "created_height desc",
-            "signed_height asc",
-            "signed_height desc",
-        ]
-        if order_by is not None and order_by.lower() not in valid_order_by:
-            raise ValueError(f"order_by must be one of: {', '.join(valid_order_by)}")
+        ok, err = self._validate_list_attestations(requester, limit, offset, order_by)
+        if not ok:
+            raise ValueError(err)
 
         # Normalize order_by to lowercase for consistent Go API calls
         if order_by is not None:
-            order_by = order_by.lower()
+            order_by = order_by.casefold()
 
         # Convert None to sentinel values
         requester_bytes = go.Slice_byte(list(requester)) if requester else go.Slice_byte([])
-        limit_val = self._coalesce_int(limit, -1)
-        offset_val = self._coalesce_int(offset, -1)
-        order_by_val = self._coalesce_str(order_by)
-
-        # Call Go function
-        go_results = truf_sdk.ListAttestations(
-            self.client,
-            requester_bytes,
-            limit_val,
-            offset_val,
-            order_by_val,
+        limit_val = -1 if limit is None else limit
+        offset_val = -1 if offset is None else offset
+        order_by_val = order_by or ""
+
+        # Call Go function; the rows come back as one JSON array of
+        # string-valued objects.
+        rows = _json_loads(
+            truf_sdk.ListAttestationsJSON(
+                self.client,
+                requester_bytes,
+                limit_val,
+                offset_val,
+                order_by_val,
+            )
         )
 
-        # Convert to Python dicts
-        results: list[AttestationMetadata] = []
-        for go_map in go_results:
-            item = dict(go_map.items())
-
-            # Parse signed_height (handle null)
-            signed_height_str = item.get("SignedHeight", "")
-            signed_height: int | None = None
-            if signed_height_str and signed_height_str != "null" and signed_height_str != "":
-                try:
-                    signed_height = int(signed_height_str)
-                except ValueError:
-                    pass
-
-            # Parse with error handling for malformed data
-            try:
-                attestation_hash = (
-                    bytes.fromhex(item.get("AttestationHash", ""))
-                    if item.get("AttestationHash")
-                    else b""
-                )
-                requester = (
-                    bytes.fromhex(item.get("Requester", ""))
-                    if item.get("Requester")
-                    else b""
-                )
-                created_height = int(item.get("CreatedHeight") or "0")
-            except (ValueError, TypeError) as e:
-                raise ValueError(
-                    f"Failed to parse attestation metadata: {e}. "
-                    f"AttestationHash: {item.get('AttestationHash')}, "
-                    f"Requester: {item.get('Requester')}, "
-                    f"CreatedHeight: {item.get('CreatedHeight')}"
-                ) from e
+        # The binding always sets every key, so the fields are unpacked by
+        # direct subscript.
+        return [_attestation_record(row) for row in rows]
 
-            results.append(
-                {
-                    "request_tx_id": item.get("RequestTxID", ""),
-                    "attestation_hash": attestation_hash,
-                    "requester": requester,
-                    "created_height": created_height,
-                    "signed_height": signed_height,
-                    "encrypt_sig": item.get("EncryptSig", "false").lower() == "true",
-                }
-            )
+    @staticmethod
+    def _validate_list_attestations(
+            requester: bytes | None = None,
+            limit: int | None = None,
+            offset: int | None = None,
+            order_by: str | None = None,
+    ) -> tuple[bool, str | None]:
+        """
+        Check list_attestations inputs without raising.
 
-        return results
+        Returns (True, None) when valid, otherwise (False, message).
+        """
+        if requester is not None and len(requester) > 20:
+            return False, f"requester must be at most 20 bytes, got {len(requester)}"
+
+        if limit is not None and (limit <= 0 or limit > 5000):
+            return False, f"limit must be between 1 and 5000, got {limit}"
+
+        if offset is not None and offset < 0:
+            return False, f"offset must be non-negative, got {offset}"
+
+        if order_by is not None and order_by.casefold() not in _ORDER_BY_ALLOWED:
+            return False, f"order_by must be one of: {', '.join(sorted(_ORDER_BY_ALLOWED))}"
+
+        return True, None
 
     def parse_attestation_payload(self, payload: bytes) -> ParsedAttestationPayload:
         """
@@ -2112,7 +2742,7 @@ class TNClient:
                 f"Payload must be bytes, got {type(full_payload).__name__}"
             )
 
-        if len(full_payload) < 66:
+        if len(full_payload) <= SIGNATURE_OVERHEAD:
             raise ValueError(
                 f"Payload too short: {len(full_payload)} bytes, expected at least 66 "
                 "(minimum 1 byte data + 65 bytes signature)"
@@ -2128,8 +2758,8 @@ class TNClient:
             raise Exception(f"Failed to verify attestation signature: {e}") from e
 
         # Extract canonical payload and signature for return
-        canonical_payload = full_payload[:-65]
-        signature = full_payload[-65:]
+        canonical_payload = full_payload[:-SIGNATURE_OVERHEAD]
+        signature = full_payload[-SIGNATURE_OVERHEAD:]
 
         return {
             "validator_address": validator_address,
@@ -2272,66 +2902,65 @@ class TNClient:
         limit_val = limit if limit is not None else 20
         offset_val = offset if offset is not None else 0
 
-        # Call Go binding
-        go_results = truf_sdk.ListTransactionFees(
-            self.client,
-            wallet,
-            mode,
-            limit_val,
-            offset_val,
+        # Call Go binding; the rows come back as one JSON array of
+        # string-valued objects.
+        rows = _json_loads(
+            truf_sdk.ListTransactionFeesJSON(
+                self.client,
+                wallet,
+                mode,
+                limit_val,
+                offset_val,
+            )
         )
 
-        # Convert to Python list of dicts
+        # Convert to Python list of dicts. The binding always sets every key,
+        # so the fields are unpacked by direct subscript.
         results: list[TransactionFeeEntry] = []
-        for go_map in go_results:
-            item = dict(go_map.items())
+        for item in rows:
+            (
+                tx_id,
+                block_height_str,
+                method,
+                caller,
+                total_fee,
+                fee_recipient,
+                metadata,
+                distribution_sequence_str,
+                distribution_recipient,
+                distribution_amount,
+            ) = _fee_row_fields(item)
 
             # Parse block height
             try:
-                block_height = int(item.get("BlockHeight", "0"))
+                block_height = int(block_height_str)
             except (ValueError, TypeError) as e:
                 raise ValueError(
                     f"Failed to parse transaction fee entry: Invalid BlockHeight. "
-                    f"BlockHeight: {item.get('BlockHeight')}, item: {item}"
+                    f"BlockHeight: {block_height_str}, item: {item}"
                 ) from e
 
             # Parse distribution sequence
             try:
-                distribution_sequence = int(item.get("DistributionSequence", "0"))
+                distribution_sequence = int(distribution_sequence_str)
             except (ValueError, TypeError) as e:
                 raise ValueError(
                     f"Failed to parse transaction fee entry: Invalid DistributionSequence. "
-                    f"DistributionSequence: {item.get('DistributionSequence')}, item: {item}"
+                    f"DistributionSequence: {distribution_sequence_str}, item: {item}"
                 ) from e
 
             # Convert nullable fields (empty string → None)
-            fee_recipient = item.get("FeeRecipient")
-            if fee_recipient == "":
-                fee_recipient = None
-
-            metadata = item.get("Metadata")
-            if metadata == "":
-                metadata = None
-
-            distribution_recipient = item.get("DistributionRecipient")
-            if distribution_recipient == "":
-                distribution_recipient = None
-
-            distribution_amount = item.get("DistributionAmount")
-            if distribution_amount == "":
-                distribution_amount = None
-
             results.append({
-                "tx_id": item.get("TxID", ""),
+                "tx_id": tx_id,
                 "block_height": block_height,
-                "method": item.get("Method", ""),
-                "caller": item.get("Caller", ""),
-                "total_fee": item.get("TotalFee", "0"),
-                "fee_recipient": fee_recipient,
-                "metadata": metadata,
+                "method": method,
+                "caller": caller,
+                "total_fee": total_fee,
+                "fee_recipient": fee_recipient or None,
+                "metadata": metadata or None,
                 "distribution_sequence": distribution_sequence,
-                "distribution_recipient": distribution_recipient,
-                "distribution_amount": distribution_amount,
+                "distribution_recipient": distribution_recipient or None,
+                "distribution_amount": distribution_amount or None,
             })
 
         return results
@@ -3457,29 +4086,18 @@ class TNClient:
         columns = resp.get("column_names", [])
         rows = resp.get("values", [])
 
-        result: list[BridgeHistory] = []
-        for row in rows:
-            record: dict = {}
-            for i, col in enumerate(columns):
-                val = row[i]
-                snake_col = to_snake_case(col)
-                # Coerce numeric fields to int
-                if snake_col in ("block_height", "block_timestamp") or snake_col.lower().endswith("height"):
-                    if val is not None:
-                        try:
-                            val = int(val)
-                        except (ValueError, TypeError):
-                            # For nullable fields, parse error sets to None
-                            # unless it's a mandatory field where we might prefer 0
-                            val = 0 if snake_col in ("block_height", "block_timestamp") else None
-                    elif snake_col in ("block_height", "block_timestamp"):
-                        val = 0
-                    else:
-                        val = None
-                record[snake_col] = val
-            result.append(cast(BridgeHistory, record))
-
-        return result
+        # Column names are converted once rather than per cell.
+        snake_columns = [to_snake_case(col) for col in columns]
+        return [
+            cast(
+                BridgeHistory,
+                {
+                    col: _coerce_history_field(col, val)
+                    for col, val in zip(snake_columns, row)
+                },
+            )
+            for row in rows
+        ]
 
     def _validate_binary_market_inputs(
         self,
@@ -3930,16 +4548,11 @@ class LocalClient:
             records: List of dicts with keys "event_time" (int) and "value"
                 (str or number). Values are stored as decimal strings.
         """
-        stream_ids: list[str] = []
-        event_times: list[int] = []
-        values: list[str] = []
-        for r in records:
-            stream_ids.append(stream_id)
-            event_times.append(int(r["event_time"]))
-            values.append(str(r["value"]))
+        event_times = [int(r["event_time"]) for r in records]
+        values = [str(r["value"]) for r in records]
         truf_sdk.LocalInsertRecords(
             self._local,
-            go.Slice_string(stream_ids),
+            go.Slice_string([stream_id] * len(records)),
             go.Slice_int64(event_times),
             go.Slice_string(values),
         )
@@ -4067,17 +4680,17 @@ class LocalClient:
         return json.loads(raw) if raw else []
 
 
+# The validators check the outer lists once, then scan the items through a
+# flat chain.from_iterable() view instead of a nested generator per list.
 def all_is_list_of_strings[T](arg_list: list[T]) -> bool:
-    return all(
-        isinstance(arg, list) and all(isinstance(item, str) for item in arg)
-        for arg in arg_list
+    return all(isinstance(arg, list) for arg in arg_list) and all(
+        isinstance(item, str) for item in chain.from_iterable(arg_list)
     )
 
 
 def all_is_list_of_floats[T](arg_list: list[T]) -> bool:
-    return all(
-        isinstance(arg, list) and all(isinstance(item, (float, int)) for item in arg)
-        for arg in arg_list
+    return all(isinstance(arg, list) for arg in arg_list) and all(
+        isinstance(item, (float, int)) for item in chain.from_iterable(arg_list)
     )
 
 
@@ -4086,3 +4699,17 @@ def to_snake_case(s: str) -> str:
     import re
     s = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', s)
     return re.sub('([a-z0-9])([A-Z])', r'\1_\2', s).lower()
+
+
+def _coerce_history_field(snake_col: str, val: Any) -> Any:
+    """Coerce a bridge history cell: block_height/block_timestamp and *height
+    columns become int (mandatory ones default to 0, the rest to None)."""
+    mandatory = snake_col in ("block_height", "block_timestamp")
+    if not (mandatory or snake_col.endswith("height")):
+        return val
+    if val is None:
+        return 0 if mandatory else None
+    try:
+        return int(val)
+    except (ValueError, TypeError):
+        return 0 if mandatory else None
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Optional, Sequence, Union
 
 from eth_hash.auto import keccak
@@ -25,9 +26,12 @@ _MAX_UINT256 = (1 << 256) - 1
 BytesLike = Union[bytes, bytearray, str, None]
 
 
+@lru_cache(maxsize=4096)
 def generate_stream_id(name: str) -> str:
     """
     Create a hash from a name, to be used as a stream ID. Must be unique among a dataprovider's streams.
+
+    The result is deterministic, so it is memoized to skip the binding call for repeated names.
     """
     return truf_sdk.GenerateStreamId(name)
 
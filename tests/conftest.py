@@ -1,15 +1,30 @@
 # conftest.py
 
-from glob import glob
+from pathlib import Path
 import pytest
 from tests.helpers.permissions import ensure_network_writer
 
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
-def refactor(string: str) -> str:
-    return string.replace("/", ".").replace("\\", ".").replace(".py", "")
+# Key of the shared session `client`; modules defining their own `client`
+# fixture override it.
+TEST_PRIVATE_KEY = "0121234567890123456789012345678901234567890123456789012345178901"
 
+# Module names are built from the file stem, so discovery doesn't depend on
+# the working directory pytest was started from.
+pytest_plugins = [
+    f"tests.fixtures.{fixture.stem}"
+    for fixture in sorted(FIXTURES_DIR.glob("*.py"))
+    if "__" not in fixture.name
+]
 
-pytest_plugins = [refactor(fixture) for fixture in glob("tests/fixtures/*.py") if "__" not in fixture]
+
+def pytest_collection_modifyitems(items):
+    """Mark every docker-backed test (the node and its network) as `integration`."""
+    for item in items:
+        # tn_node depends on docker_network, so this covers node tests too
+        if "docker_network" in getattr(item, "fixturenames", ()):
+            item.add_marker(pytest.mark.integration)
 
 
 @pytest.fixture(scope="session")
@@ -23,3 +38,31 @@ def grant_network_writer(manager_client):
     def _grant(client):
         ensure_network_writer(manager_client, client.get_current_account())
     return _grant
+
+
+@pytest.fixture
+def offline_client():
+    """
+    A TNClient that skips the node connection, for unit tests of client-side
+    checks and of code paths whose bindings are monkeypatched.
+    """
+    # Local import to avoid loading the SDK bindings at collection time
+    from trufnetwork_sdk_py import TNClient
+
+    c = TNClient.__new__(TNClient)
+    c.client = object()
+    return c
+
+
+@pytest.fixture(scope="session")
+def client(tn_node, grant_network_writer):
+    """
+    A TNClient with the network_writer role, shared by the whole session.
+    Uses the tn_node fixture to get a running server.
+    """
+    # Local import to avoid loading the SDK bindings at collection time
+    from trufnetwork_sdk_py import TNClient
+
+    client = TNClient(tn_node, TEST_PRIVATE_KEY)
+    grant_network_writer(client)
+    return client
@@ -1,13 +1,17 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
+from functools import cache
+import hashlib
 import json
 import logging
 import os
-import shutil
+import socket
+import struct
 import subprocess
+import threading
 import time
 import pytest
-from eth_account import Account
-from typing import Optional
+from typing import Callable, Optional
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -31,6 +35,20 @@ SYSTEM_OWNER = "system"
 
 NETWORK_WRITER_ROLE = "network_writer"
 
+# With PYTEST_REUSE_CONTAINERS=1 the node containers and network are left
+# running after the session and reattached by the next one, skipping the
+# boot and migration cost.
+REUSE_CONTAINERS = os.environ.get("PYTEST_REUSE_CONTAINERS") == "1"
+
+# Run the throwaway test containers without a seccomp profile and in the host
+# cgroup namespace, skipping per-container seccomp filter setup and cgroup
+# namespace creation. Set TN_FAST_START=0 to keep docker's defaults.
+FAST_START = os.environ.get("TN_FAST_START", "1") != "0"
+
+# Label carrying ContainerSpec.spec_hash, so a reused container is only
+# reattached if it was started from the same spec.
+SPEC_HASH_LABEL = "tn-test-spec-hash"
+
 
 @dataclass
 class ContainerSpec:
@@ -39,6 +57,9 @@ class ContainerSpec:
     name: str
     image: str
     tmpfs_path: Optional[str] = None
+    # Explicitly sized, noatime RAM-backed data dir: no atime updates while
+    # postgres/kwild initialize
+    tmpfs_options: str = "rw,noatime,size=2g"
     env_vars: list[str] = field(default_factory=list)
     ports: dict[str, str] = field(default_factory=dict)
     entrypoint: Optional[str] = None
@@ -52,6 +73,11 @@ class ContainerSpec:
         if self.args is None:
             self.args = []
 
+    @property
+    def spec_hash(self) -> str:
+        """Hash of the spec, used to detect a reused container with a stale configuration"""
+        return hashlib.sha256(repr(self).encode()).hexdigest()
+
 
 # Container specifications
 POSTGRES_CONTAINER = ContainerSpec(
@@ -110,13 +136,15 @@ TN_DB_CONTAINER = ContainerSpec(
 )
 
 
-def run_docker_command(args: list[str], check: bool = False) -> subprocess.CompletedProcess:
+def run_docker_command(args: list[str], check: bool = False, capture: bool = True) -> subprocess.CompletedProcess:
     """
     Executes a docker command with the given list of arguments.
 
     Args:
         args: List of command arguments to pass to docker
         check: If True, raises CalledProcessError on non-zero exit status
+        capture: If False, stdout is discarded instead of read into the result;
+            stderr is always captured, as it feeds the error logs
 
     Returns:
         CompletedProcess instance with command output
@@ -127,7 +155,13 @@ def run_docker_command(args: list[str], check: bool = False) -> subprocess.Compl
     command = ["docker", *args]
     logger.debug(f"Running docker command: {' '.join(command)}")
     try:
-        result = subprocess.run(command, capture_output=True, text=True, check=check)
+        result = subprocess.run(
+            command,
+            stdout=subprocess.PIPE if capture else subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            check=check,
+        )
         if result.stderr:
             logger.debug(f"Docker command stderr: {result.stderr}")
         return result
@@ -136,139 +170,327 @@ def run_docker_command(args: list[str], check: bool = False) -> subprocess.Compl
         raise
 
 
-def wait_for_postgres_health(max_attempts: int = 30) -> bool:
+def prewarm_images(*specs: ContainerSpec) -> None:
+    """
+    Pull any spec image that isn't present locally
+
+    This mirrors docker run's pull-if-missing: a local image is never
+    re-pulled, so locally built node images are left alone.
+
+    Args:
+        specs: Container specifications whose images to prepare
+    """
+    for spec in specs:
+        try:
+            if run_docker_command(["image", "inspect", spec.image], capture=False).returncode != 0:
+                logger.info(f"Pulling image {spec.image}...")
+                run_docker_command(["pull", spec.image], capture=False)
+        except OSError as e:
+            logger.debug(f"Could not prewarm image {spec.image}: {e!s}")
+
+
+# Images are checked (and pulled if missing) in the background from import,
+# overlapping pytest collection; start_container joins this thread before
+# docker run. Set PYTEST_PREWARM_IMAGES=0 to disable.
+_prewarm_thread: Optional[threading.Thread] = None
+if os.environ.get("PYTEST_PREWARM_IMAGES", "1") != "0":
+    _prewarm_thread = threading.Thread(
+        target=prewarm_images,
+        args=(POSTGRES_CONTAINER, TN_DB_CONTAINER),
+        name="tn-image-prewarm",
+        daemon=True,
+    )
+    _prewarm_thread.start()
+
+
+def poll_until(probe: Callable[[int], bool], timeout: float) -> bool:
+    """
+    Call probe with the attempt number until it returns True or the timeout expires
+
+    The first probe runs immediately; the delay between probes starts at 50ms
+    and backs off by 1.5x up to 1s, so a service that comes up quickly is
+    noticed quickly without hammering a slow one.
+
+    Args:
+        probe: Health check, called with the 1-based attempt number
+        timeout: Seconds to keep polling for
+
+    Returns:
+        bool: True if the probe succeeded before the deadline, False otherwise
+    """
+    deadline = time.monotonic() + timeout
+    delay = 0.05
+    attempt = 0
+    while True:
+        attempt += 1
+        if probe(attempt):
+            return True
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(delay, 1.0, remaining))
+        delay *= 1.5
+
+
+def postgres_accepts_connections(host: str, port: int, timeout: float = 0.5) -> bool:
+    """
+    Probe postgres from the host, the way pg_isready does, without docker exec
+
+    A bare TCP connect isn't enough: docker's port proxy accepts connections
+    before postgres listens, and postgres accepts them while still starting
+    up. So a protocol 3.0 startup message is sent, and the server counts as
+    ready once it answers with an authentication request ('R') rather than
+    an error ('E') or a closed connection.
+
+    Args:
+        host: Host the postgres port is published on
+        port: Published postgres port
+        timeout: Socket timeout in seconds
+
+    Returns:
+        bool: True if postgres is accepting connections, False otherwise
+
+    Raises:
+        OSError: If the port can't be reached
+    """
+    body = struct.pack("!i", 3 << 16) + b"user\0postgres\0database\0postgres\0\0"
+    with socket.create_connection((host, port), timeout=timeout) as sock:
+        sock.sendall(struct.pack("!i", len(body) + 4) + body)
+        ready = sock.recv(1) == b"R"
+        if ready:
+            try:
+                sock.sendall(b"X\0\0\0\4")  # Terminate
+            except OSError:
+                pass
+        return ready
+
+
+def wait_for_postgres_health(timeout: float = 30) -> bool:
     """
     Wait for postgres container to be healthy
 
     Args:
-        max_attempts: Maximum number of health check attempts
+        timeout: Seconds to wait for postgres to become healthy
 
     Returns:
         bool: True if postgres becomes healthy, False otherwise
     """
-    for i in range(max_attempts):
+
+    host_port = int(next(iter(POSTGRES_CONTAINER.ports)))
+
+    def probe(attempt: int) -> bool:
         try:
-            result = run_docker_command(["exec", POSTGRES_CONTAINER.name, "pg_isready", "-U", "postgres"])
-            if result.returncode == 0:
-                logger.info(f"Postgres is healthy after {i+1} attempts")
+            if postgres_accepts_connections("localhost", host_port):
+                logger.info(f"Postgres is healthy after {attempt} attempts")
                 return True
-            logger.debug(f"Postgres not ready (attempt {i+1}/{max_attempts}): {result.stderr}")
-        except Exception as e:
-            logger.error(f"Error checking postgres health: {e!s}")
-        time.sleep(1)
-    return False
+            logger.debug(f"Postgres not ready (attempt {attempt})")
+        except OSError as e:
+            logger.debug(f"Postgres not reachable (attempt {attempt}): {e!s}")
+        return False
+
+    return poll_until(probe, timeout)
 
 
-def wait_for_tn_health(max_attempts: int = 10) -> bool:
+def wait_for_tn_health(timeout: float = 10) -> bool:
     """
     Wait for TN-DB node to be healthy and produce first block
 
     Args:
-        max_attempts: Maximum number of health check attempts
+        timeout: Seconds to wait for TN-DB to become healthy
 
     Returns:
         bool: True if TN-DB becomes healthy, False otherwise
     """
     import requests
 
-    for i in range(max_attempts):
+    def probe(attempt: int) -> bool:
         try:
-            logger.info(f"Checking TN-DB health (attempt {i+1}/{max_attempts})")
-            response = requests.get("http://localhost:8484/api/v1/health")
+            logger.debug(f"Checking TN-DB health (attempt {attempt})")
+            response = session.get(f"{KWIL_PROVIDER_URL}/api/v1/health", timeout=5)
             if response.status_code == 200:
                 data = response.json()
                 if data.get("healthy") and data.get("services").get("user").get("block_height") >= 1:
-                    logger.info(f"TN-DB is healthy after {i+1} attempts")
-                    logger.debug(f"Health check response: {json.dumps(data, indent=2)}")
+                    logger.info(f"TN-DB is healthy after {attempt} attempts")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"Health check response: {json.dumps(data, indent=2)}")
                     return True
-            logger.debug(f"TN-DB not healthy yet (attempt {i+1}/{max_attempts}): {response.text}")
+            logger.debug(f"TN-DB not healthy yet (attempt {attempt}): {response.text}")
         except Exception as e:
-            logger.debug(f"Error checking TN-DB health (attempt {i+1}/{max_attempts}): {e!s}")
-        time.sleep(1)
-    return False
+            logger.debug(f"Error checking TN-DB health (attempt {attempt}): {e!s}")
+        return False
+
+    # One session keeps the connection open across probes.
+    with requests.Session() as session:
+        return poll_until(probe, timeout)
 
 
-def run_migration_task() -> bool:
+@cache
+def manager_address() -> str:
+    """
+    Manager wallet address, which the migration assigns the manager roles
+
+    Derived once, on first use: eth_account is only imported when a session
+    actually runs the migration, keeping it off the collection path.
+
+    Returns:
+        str: Lowercase hex address derived from MANAGER_PRIVATE_KEY
+    """
+    from eth_account import Account
+
+    return Account.from_key(MANAGER_PRIVATE_KEY).address.lower()
+
+
+def run_migration_task(retry_for: float = 0) -> bool:
     """
     Run the migration task using the command from server_fixture.go.
 
+    Args:
+        retry_for: Seconds to keep retrying a failed attempt, so the task can
+            be started before the node is ready to accept it
+
     Returns:
         bool: True if migration task is successful, False otherwise.
     """
     logger.info("Running migration task...")
     node_repo_dir = os.environ.get("NODE_REPO_DIR")
-    node_repo_dir = os.path.expanduser(node_repo_dir)
     if not node_repo_dir:
         logger.error("NODE_REPO_DIR environment variable not set. Migration task cannot run.")
         return False
+    node_repo_dir = os.path.expanduser(node_repo_dir)
 
     provider_arg = f"PROVIDER={KWIL_PROVIDER_URL}"
     private_key_arg = f"PRIVATE_KEY={DB_PRIVATE_KEY}"
 
-    # Derive the admin wallet (manager address) so migrations can assign manager roles
-    admin_wallet_arg: Optional[str] = None
-    admin_wallet_address = Account.from_key(MANAGER_PRIVATE_KEY).address.lower()
-    admin_wallet_arg = f"ADMIN_WALLET={admin_wallet_address}"
-    logger.info(f"Derived admin wallet {admin_wallet_address} from manager private key")
+    # The admin wallet (manager address) lets migrations assign manager roles
+    admin_wallet_arg = f"ADMIN_WALLET={manager_address()}"
+    logger.info(f"Using admin wallet {manager_address()} derived from manager private key")
 
-    command = ["task", "action:migrate", provider_arg, private_key_arg]
-    if admin_wallet_arg:
-        command.append(admin_wallet_arg)
+    command = ["task", "action:migrate", provider_arg, private_key_arg, admin_wallet_arg]
 
-    logger.info(f"Executing command in {node_repo_dir}: {' '.join(command)}")
-    try:
-        result = subprocess.run(
-            command,
-            cwd=node_repo_dir,
-            capture_output=True,
-            text=True,
-            check=True,  # Raise CalledProcessError on non-zero exit
-            timeout=180,  # 3-minute timeout — migration typically completes in seconds
-        )
-        logger.info(f"Migration task successful. Output:\n{result.stdout}")
-        if result.stderr:
-            logger.warning(f"Migration task stderr:\n{result.stderr}")
-        return True
-    except subprocess.TimeoutExpired as e:
-        logger.error(f"Migration task timed out after {e.timeout}s in {node_repo_dir}")
-        if e.stdout:
-            logger.debug(f"Migration timeout stdout (truncated): {str(e.stdout)[:500]}")
-        if e.stderr:
-            logger.debug(f"Migration timeout stderr (truncated): {str(e.stderr)[:500]}")
-        return False
-    except FileNotFoundError:
-        logger.error(
-            f"Migration task command 'task' not found. Ensure it's in PATH or NODE_REPO_DIR ({node_repo_dir}) is correct and contains the executable."
-        )
-        return False
-    except subprocess.CalledProcessError as e:
-        logger.error(f"Migration task failed in {node_repo_dir}. Error: {e}")
-        logger.error(f"Stdout: {e.stdout}")
-        logger.error(f"Stderr: {e.stderr}")
-        return False
-    except Exception as e:
-        logger.error(f"An unexpected error occurred during migration task: {e!s}")
-        return False
+    def attempt(attempt: int) -> bool:
+        logger.info(f"Executing command in {node_repo_dir} (attempt {attempt}): {' '.join(command)}")
+        try:
+            result = subprocess.run(
+                command,
+                cwd=node_repo_dir,
+                capture_output=True,
+                text=True,
+                check=True,  # Raise CalledProcessError on non-zero exit
+                timeout=180,  # 3-minute timeout — migration typically completes in seconds
+            )
+            logger.info(f"Migration task successful. Output:\n{result.stdout}")
+            if result.stderr:
+                logger.warning(f"Migration task stderr:\n{result.stderr}")
+            return True
+        except subprocess.TimeoutExpired as e:
+            logger.error(f"Migration task timed out after {e.timeout}s in {node_repo_dir}")
+            if e.stdout:
+                logger.debug(f"Migration timeout stdout (truncated): {str(e.stdout)[:500]}")
+            if e.stderr:
+                logger.debug(f"Migration timeout stderr (truncated): {str(e.stderr)[:500]}")
+            return False
+        except FileNotFoundError:
+            logger.error(
+                f"Migration task command 'task' not found. Ensure it's in PATH or NODE_REPO_DIR ({node_repo_dir}) is correct and contains the executable."
+            )
+            return False
+        except subprocess.CalledProcessError as e:
+            logger.error(f"Migration task failed in {node_repo_dir}. Error: {e}")
+            logger.error(f"Stdout: {e.stdout}")
+            logger.error(f"Stderr: {e.stderr}")
+            return False
+        except Exception as e:
+            logger.error(f"An unexpected error occurred during migration task: {e!s}")
+            return False
+
+    return poll_until(attempt, retry_for)
+
+
+def are_reusable(*specs: ContainerSpec) -> bool:
+    """
+    Check, with a single docker inspect, whether containers for all the specs
+    are already running with matching spec hashes
+
+    Args:
+        specs: Container specifications
+
+    Returns:
+        bool: True if every running container can be reattached, False otherwise
+    """
+    result = run_docker_command(
+        [
+            "inspect",
+            "--format",
+            f'{{{{.State.Running}}}} {{{{index .Config.Labels "{SPEC_HASH_LABEL}"}}}}',
+            *(spec.name for spec in specs),
+        ]
+    )
+    # inspect prints one line per container found, in argument order, and
+    # exits non-zero if any is missing
+    expected = [f"true {spec.spec_hash}" for spec in specs]
+    return result.returncode == 0 and result.stdout.splitlines() == expected
+
+
+# `docker logs -f` processes started by follow_logs, by container name
+_log_followers: dict[str, subprocess.Popen] = {}
 
 
-def start_container(spec: ContainerSpec, network: str) -> bool:
+def follow_logs(name: str) -> None:
+    """
+    Stream a container's output to the debug log line by line from a daemon thread
+
+    Args:
+        name: Name of the container to follow
+    """
+    process = subprocess.Popen(
+        ["docker", "logs", "-f", name],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    )
+    _log_followers[name] = process
+
+    def pump() -> None:
+        with process.stdout:
+            for line in process.stdout:
+                logger.debug(f"[{name}] {line.rstrip()}")
+
+    threading.Thread(target=pump, name=f"logs-{name}", daemon=True).start()
+
+
+def start_container(spec: ContainerSpec, network: str, reuse: bool = False) -> bool:
     """
     Start a docker container with the given specification
 
     Args:
         spec: Container specification
         network: Docker network name
+        reuse: If True, the running container has been checked with are_reusable
+            and is reattached instead of restarted
 
     Returns:
         bool: True if container starts successfully, False otherwise
     """
+    if reuse:
+        logger.info(f"Reusing running container {spec.name}")
+        return True
+
+    if _prewarm_thread is not None:
+        _prewarm_thread.join()
+
     # First ensure container doesn't exist
-    run_docker_command(["rm", "-f", spec.name])
+    run_docker_command(["rm", "-f", spec.name], capture=False)
 
-    args = ["run", "--rm", "--name", spec.name, "--network", network, "-d"]
+    args = ["run", "--name", spec.name, "--network", network, "-d"]
+    if not REUSE_CONTAINERS:
+        args.append("--rm")
+    args.extend(["--label", f"{SPEC_HASH_LABEL}={spec.spec_hash}"])
+    if FAST_START:
+        args.extend(["--security-opt", "seccomp=unconfined", "--cgroupns=host"])
 
     if spec.tmpfs_path:
-        args.extend(["--tmpfs", spec.tmpfs_path])
+        # Swapping the tmpfs out would defeat the point of keeping it in RAM
+        args.extend(["--tmpfs", f"{spec.tmpfs_path}:{spec.tmpfs_options}", "--memory-swappiness=0"])
 
     for env in spec.env_vars:
         args.extend(["-e", env])
@@ -285,44 +507,54 @@ def start_container(spec: ContainerSpec, network: str) -> bool:
         args.extend(spec.args)
 
     try:
-        run_docker_command(args, check=True)
+        run_docker_command(args, check=True, capture=False)
         logger.info(f"Successfully started container {spec.name}")
 
-        # Get container logs
-        time.sleep(2)  # Wait a bit for container to initialize
-        logs = run_docker_command(["logs", spec.name])
-        logger.debug(f"Container logs for {spec.name}:")
-        logger.debug(logs.stdout)
-        if logs.stderr:
-            logger.debug(f"Container stderr: {logs.stderr}")
+        # Stream container logs, only when they'd actually be logged.
+        # Readiness is left to the health checks, so there is no settle delay
+        # here.
+        if logger.isEnabledFor(logging.DEBUG):
+            follow_logs(spec.name)
         return True
     except subprocess.CalledProcessError as e:
         logger.error(f"Failed to start container {spec.name}: {e.stderr}")
         return False
 
 
-def stop_container(name: str) -> bool:
+def stop_container(*names: str, timeout: int = 1) -> bool:
     """
-    Stop a docker container
+    Stop one or more docker containers with a single docker invocation
+
+    The docker CLI stops the named containers concurrently. The throwaway test
+    containers get a short grace period before SIGKILL instead of docker's
+    default 10s.
 
     Args:
-        name: Name of the container to stop
+        names: Names of the containers to stop
+        timeout: Seconds to wait after SIGTERM before killing a container
 
     Returns:
-        bool: True if container stops successfully, False otherwise
+        bool: True if all containers stop successfully, False otherwise
     """
-    logger.info(f"Stopping container {name}...")
+    label = ", ".join(names)
+    # Log followers are always stopped, even for containers left running
+    for name in names:
+        follower = _log_followers.pop(name, None)
+        if follower is not None:
+            follower.terminate()
+
+    if REUSE_CONTAINERS:
+        logger.info(f"Leaving container {label} running for reuse")
+        return True
+
+    logger.info(f"Stopping container {label}...")
     try:
-        run_docker_command(["stop", name], check=True)
-        logger.info(f"Successfully stopped container {name}")
+        run_docker_command(["stop", "-t", str(timeout), *names], check=True, capture=False)
+        logger.info(f"Successfully stopped container {label}")
         return True
     except subprocess.CalledProcessError as e:
-        logger.error(f"Failed to stop container {name}: {e.stderr}")
+        logger.error(f"Failed to stop container {label}: {e.stderr}")
         return False
-    finally:
-        # Clean up config dir if it exists
-        if name == TN_DB_CONTAINER.name and hasattr(TN_DB_CONTAINER, "_config_dir"):
-            shutil.rmtree(getattr(TN_DB_CONTAINER, "_config_dir"), ignore_errors=True)
 
 
 @pytest.fixture(scope="session")
@@ -343,13 +575,19 @@ def docker_network():
     Raises:
         pytest.FixureError: If network creation fails
     """
+    if REUSE_CONTAINERS and run_docker_command(["network", "inspect", NETWORK_NAME], capture=False).returncode == 0:
+        # Reused containers are still attached to the existing network.
+        logger.info(f"Reusing docker network '{NETWORK_NAME}'")
+        yield NETWORK_NAME
+        return
+
     logger.info("Setting up docker network...")
     # Remove existing network (ignore errors)
-    run_docker_command(["network", "rm", NETWORK_NAME])
+    run_docker_command(["network", "rm", NETWORK_NAME], capture=False)
 
     # Create the new network
     try:
-        run_docker_command(["network", "create", NETWORK_NAME], check=True)
+        run_docker_command(["network", "create", NETWORK_NAME], check=True, capture=False)
         logger.info(f"Docker network '{NETWORK_NAME}' created.")
     except subprocess.CalledProcessError as e:
         logger.error(f"Failed to create docker network '{NETWORK_NAME}': {e.stderr}")
@@ -358,9 +596,12 @@ def docker_network():
     try:
         yield NETWORK_NAME
     finally:
-        logger.info("Tearing down docker network...")
-        run_docker_command(["network", "rm", NETWORK_NAME])
-        logger.info(f"Docker network '{NETWORK_NAME}' removed.")
+        if REUSE_CONTAINERS:
+            logger.info(f"Leaving docker network '{NETWORK_NAME}' for reuse")
+        else:
+            logger.info("Tearing down docker network...")
+            run_docker_command(["network", "rm", NETWORK_NAME], capture=False)
+            logger.info(f"Docker network '{NETWORK_NAME}' removed.")
 
 
 @pytest.fixture(scope="session")
@@ -369,11 +610,16 @@ def tn_node(docker_network):
     Pytest fixture that sets up a TN-DB node with Postgres for testing.
 
     This fixture:
-    1. Starts a Postgres container
-    2. Waits for Postgres to be healthy
-    3. Starts the TN-DB node
-    4. Waits for the node to be healthy and produce its first block
-    5. Cleans up both containers after tests
+    1. Starts the Postgres and TN-DB containers back-to-back
+    2. Waits concurrently for Postgres to be healthy and for the node to be
+       healthy and produce its first block
+    3. Runs the migration task alongside those checks, retrying until the
+       node accepts it
+    4. Cleans up both containers after tests, or on any setup failure
+
+    With PYTEST_REUSE_CONTAINERS=1, the containers are left running
+    afterwards, and are reattached (skipping the migration) when both are
+    still running with a matching spec hash label.
 
     Args:
         docker_network: The docker network fixture
@@ -384,38 +630,52 @@ def tn_node(docker_network):
     Raises:
         pytest.FixureError: If container setup fails
     """
-    logger.info("Starting Postgres container...")
-    if not start_container(POSTGRES_CONTAINER, docker_network):
-        pytest.fail("Failed to start Postgres container")
-
-    logger.info("Waiting for Postgres to be healthy...")
-    if not wait_for_postgres_health():
-        stop_container(POSTGRES_CONTAINER.name)
-        pytest.fail("Postgres failed to become healthy")
-
-    logger.info("Starting TN-DB container...")
-    if not start_container(TN_DB_CONTAINER, docker_network):
-        stop_container(POSTGRES_CONTAINER.name)
-        pytest.fail("Failed to start TN-DB container")
-
-    logger.info("Waiting for TN-DB node to be healthy...")
-    if not wait_for_tn_health():
-        stop_container(TN_DB_CONTAINER.name)
-        stop_container(POSTGRES_CONTAINER.name)
-        pytest.fail("TN-DB node failed to become healthy")
-
-    logger.info("Running migration task after TN-DB is healthy...")
-    if not run_migration_task():
-        stop_container(TN_DB_CONTAINER.name)
-        stop_container(POSTGRES_CONTAINER.name)
-        pytest.fail("Migration task failed")
+    # The pair is only reattached together: a reused node has already been
+    # migrated, and a fresh node must not start against an old database.
+    reused = REUSE_CONTAINERS and are_reusable(POSTGRES_CONTAINER, TN_DB_CONTAINER)
 
     try:
+        logger.info("Starting Postgres container...")
+        if not start_container(POSTGRES_CONTAINER, docker_network, reuse=reused):
+            pytest.fail("Failed to start Postgres container")
+
+        # TN-DB is started right behind Postgres rather than after it is
+        # healthy, so Postgres' boot time overlaps TN-DB's startup.
+        logger.info("Starting TN-DB container...")
+        if not start_container(TN_DB_CONTAINER, docker_network, reuse=reused):
+            pytest.fail("Failed to start TN-DB container")
+
+        # The TN-DB wait keeps the combined budget of the sequential waits
+        # (30s for Postgres + 10s for TN-DB), since it also covers the time
+        # Postgres takes to come up. The migration task is started alongside
+        # the health checks and retried until the node accepts it.
+        logger.info("Waiting for Postgres and TN-DB node to be healthy...")
+        health_checks = {
+            "Postgres": wait_for_postgres_health,
+            "TN-DB node": lambda: wait_for_tn_health(timeout=40),
+        }
+        pool = ThreadPoolExecutor(max_workers=len(health_checks) + 1)
+        try:
+            if reused:
+                logger.info("Skipping migration task for reused TN-DB node")
+                migration = None
+            else:
+                migration = pool.submit(run_migration_task, 60)
+            futures = {pool.submit(check): name for name, check in health_checks.items()}
+            unhealthy = [futures[future] for future in as_completed(futures) if not future.result()]
+            if unhealthy:
+                pytest.fail(f"{' and '.join(sorted(unhealthy))} failed to become healthy")
+
+            if migration is not None and not migration.result():
+                pytest.fail("Migration task failed")
+        finally:
+            # Don't block a failed setup on a migration that is still retrying.
+            pool.shutdown(wait=False, cancel_futures=True)
+
         yield KWIL_PROVIDER_URL
     finally:
         logger.info("Cleaning up containers...")
-        stop_container(TN_DB_CONTAINER.name)
-        stop_container(POSTGRES_CONTAINER.name)
+        stop_container(TN_DB_CONTAINER.name, POSTGRES_CONTAINER.name)
 
 
 class TrufNetworkProvider:
@@ -463,7 +723,7 @@ class TestTrufNetworkFixtures:
     def test_docker_network_fixture(self, docker_network):
         """Test docker network creation and cleanup"""
         # Check network exists
-        result = run_docker_command(["network", "inspect", docker_network])
+        result = run_docker_command(["network", "inspect", docker_network], capture=False)
         assert result.returncode == 0, "Docker network should exist during test"
 
     def test_tn_node_fixture(self, tn_node):
@@ -478,10 +738,12 @@ class TestTrufNetworkFixtures:
         assert data.get("healthy") is True
         assert data.get("services").get("user").get("block_height") >= 1
 
-        # Verify containers are running
-        for container in [POSTGRES_CONTAINER.name, TN_DB_CONTAINER.name]:
-            result = run_docker_command(["container", "inspect", container])
-            assert result.returncode == 0, f"Container {container} should be running"
+        # Verify containers are running; one inspect covers both, and fails
+        # if either is missing.
+        containers = [POSTGRES_CONTAINER.name, TN_DB_CONTAINER.name]
+        result = run_docker_command(["container", "inspect", *containers])
+        assert result.returncode == 0, f"Containers {containers} should be running"
+        assert len(json.loads(result.stdout)) == len(containers)
 
     def test_tn_provider_fixture(self, tn_provider):
         """Test TrufNetworkProvider configuration"""
@@ -1,14 +1,26 @@
 from tests.fixtures.test_trufnetwork import SYSTEM_OWNER, NETWORK_WRITER_ROLE
 
+# (owner, role, wallet) memberships already confirmed or granted this session.
+# Tests that revoke the role (test_role_management) use their own wallets,
+# which never go through this helper.
+_granted: set[tuple[str, str, str]] = set()
+
 
 def ensure_network_writer(manager_client, wallet: str):
     """
     Grant `system:network_writer` to `wallet` if it doesn't already have it.
-    
+
+    The result is remembered for the session, so repeated calls for the same
+    wallet skip the membership query.
+
     Args:
         manager_client: TNClient instance with manager privileges
         wallet: Wallet address (string) to grant the role to
     """
+    key = (SYSTEM_OWNER, NETWORK_WRITER_ROLE, wallet.lower())
+    if key in _granted:
+        return
+
     status = manager_client.are_members_of(
         SYSTEM_OWNER, NETWORK_WRITER_ROLE, [wallet]
     )[0]["is_member"]
@@ -16,4 +28,5 @@ def ensure_network_writer(manager_client, wallet: str):
     if not status:
         manager_client.grant_role(
             SYSTEM_OWNER, NETWORK_WRITER_ROLE, [wallet], wait=True
-        ) 
\ No newline at end of file
+        )
+    _granted.add(key)
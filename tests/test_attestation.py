@@ -1,25 +1,36 @@
 """
 Unit tests for attestation functionality.
 
-These tests focus on input validation and error handling.
+These tests focus on input validation and error handling. The validation
+tests use the offline_client fixture, which never connects, so they need no node.
 """
 
-import pytest
-from trufnetwork_sdk_py.client import TNClient
-
-# Test configuration
-TEST_PRIVATE_KEY = "0121234567890123456789012345678901234567890123456789012345178901"
+import re
 
+import pytest
 
-@pytest.fixture(scope="module")
-def client(tn_node, grant_network_writer):
-    """
-    Pytest fixture to create a TNClient instance for testing.
-    Uses the tn_node fixture to get a running server.
-    """
-    client = TNClient(tn_node, TEST_PRIVATE_KEY)
-    grant_network_writer(client)
-    return client
+import trufnetwork_sdk_py.client as client_mod
+from trufnetwork_sdk_py.client import (
+    SIGNATURE_OVERHEAD,
+    AttestationNotReadyError,
+    AttestationRecord,
+)
+
+# Fixed-length inputs shared by the tests
+_DP_1S = "0x" + "1" * 40
+_DP_0S = "0x" + "0" * 40
+_DP_NO_0X = "47" + "1" * 40  # 42 chars, missing the 0x prefix
+_SID_ZEROS = "st" + "0" * 30
+_REQ_10 = b"x" * 10
+_REQ_20 = b"x" * 20
+_REQ_21 = b"x" * 21
+
+# Valid request_attestation arguments; each validation case overrides one field
+BASE_REQUEST_KWARGS = dict(
+    data_provider=_DP_1S,
+    stream_id=_SID_ZEROS,
+    action_name="get_record",
+)
 
 
 class TestAttestationInputValidation:
@@ -29,137 +40,98 @@ class TestAttestationInputValidation:
     #     request_attestation() validation
     # ==========================================
 
-    def test_request_attestation_invalid_data_provider_length(self, client):
-        """Test that data_provider must be exactly 42 characters"""
-        with pytest.raises(ValueError, match="data_provider must be 42 characters"):
-            client.request_attestation(
-                data_provider="0x1234",  # Too short
-                stream_id="st" + "0" * 30,
-                action_name="get_record",
-                args=[],
-                wait=False,
-            )
-
-    def test_request_attestation_missing_0x_prefix(self, client):
-        """Test that data_provider must start with 0x"""
-        # Length check happens first, so use correct length without 0x
-        with pytest.raises(ValueError, match="data_provider must start with '0x'"):
-            client.request_attestation(
-                data_provider="47" + "1" * 40,  # 42 chars but missing 0x
-                stream_id="st" + "0" * 30,
-                action_name="get_record",
-                args=[],
-                wait=False,
-            )
-
-    def test_request_attestation_invalid_stream_id_length(self, client):
-        """Test that stream_id must be exactly 32 characters"""
-        with pytest.raises(ValueError, match="stream_id must be 32 characters"):
-            client.request_attestation(
-                data_provider="0x" + "1" * 40,
-                stream_id="st123",  # Too short
-                action_name="get_record",
-                args=[],
-                wait=False,
-            )
-
-    def test_request_attestation_empty_action_name(self, client):
-        """Test that action_name cannot be empty"""
+    @pytest.mark.parametrize(
+        "override,match",
+        [
+            # Too short
+            ({"data_provider": "0x1234"}, "data_provider must be 42 characters"),
+            # 42 chars but missing 0x (length check happens first)
+            ({"data_provider": _DP_NO_0X}, "data_provider must start with '0x'"),
+            # Too short
+            ({"stream_id": "st123"}, "stream_id must be 32 characters"),
+            ({"action_name": ""}, "action_name cannot be empty"),
+            # Signature encryption is not supported in MVP
+            ({"encrypt_sig": True}, "Signature encryption is not supported in MVP"),
+            # Contains non-digit characters
+            ({"max_fee": "-100"}, "max_fee must be a numeric string"),
+        ],
+        ids=["short_dp", "no_0x", "short_sid", "empty_action", "encrypt", "neg_fee"],
+    )
+    def test_request_attestation_invalid_input(self, offline_client, override, match):
+        """Test that each invalid request_attestation field is rejected"""
+        ok, msg = offline_client._validate_request_attestation(**{**BASE_REQUEST_KWARGS, **override})
+        assert not ok
+        assert re.search(match, msg)
+
+    def test_request_attestation_raises_on_invalid_input(self, offline_client):
+        """Test that request_attestation surfaces validation failures as ValueError"""
         with pytest.raises(ValueError, match="action_name cannot be empty"):
-            client.request_attestation(
-                data_provider="0x" + "1" * 40,
-                stream_id="st" + "0" * 30,
-                action_name="",  # Empty
-                args=[],
-                wait=False,
-            )
-
-    def test_request_attestation_encryption_not_supported(self, client):
-        """Test that signature encryption is not supported in MVP"""
-        with pytest.raises(
-            ValueError, match="Signature encryption is not supported in MVP"
-        ):
-            client.request_attestation(
-                data_provider="0x" + "1" * 40,
-                stream_id="st" + "0" * 30,
-                action_name="get_record",
-                args=[],
-                encrypt_sig=True,  # Not supported
-                wait=False,
-            )
-
-    def test_request_attestation_negative_max_fee(self, client):
-        """Test that max_fee must be a valid numeric string"""
-        with pytest.raises(ValueError, match="max_fee must be a numeric string"):
-            client.request_attestation(
-                data_provider="0x" + "1" * 40,
-                stream_id="st" + "0" * 30,
-                action_name="get_record",
-                args=[],
-                max_fee="-100",  # Invalid: contains non-digit characters
-                wait=False,
+            offline_client.request_attestation(
+                **{**BASE_REQUEST_KWARGS, "action_name": ""}, args=[], wait=False
             )
 
     # ==========================================
     #   get_signed_attestation() validation
     # ==========================================
 
-    def test_get_signed_attestation_empty_request_tx_id(self, client):
+    def test_get_signed_attestation_empty_request_tx_id(self, offline_client):
         """Test that request_tx_id cannot be empty"""
         with pytest.raises(ValueError, match="request_tx_id cannot be empty"):
-            client.get_signed_attestation("")
+            offline_client.get_signed_attestation("")
+
+    def test_get_signed_attestation_require_signed(self, offline_client, monkeypatch):
+        """Test that an unsigned payload raises only when require_signed is set"""
+        unsigned = b"\x01" * SIGNATURE_OVERHEAD
+        monkeypatch.setattr(
+            client_mod.truf_sdk, "GetSignedAttestation", lambda client, tx: unsigned, raising=False
+        )
+
+        assert offline_client.get_signed_attestation("0xabc") == unsigned
+        with pytest.raises(AttestationNotReadyError) as exc_info:
+            offline_client.get_signed_attestation("0xabc", require_signed=True)
+        assert exc_info.value.payload == unsigned
 
     # ==========================================
     #     list_attestations() validation
     # ==========================================
 
-    def test_list_attestations_requester_too_long(self, client):
-        """Test that requester must be at most 20 bytes"""
-        with pytest.raises(ValueError, match="requester must be at most 20 bytes"):
-            client.list_attestations(requester=b"x" * 21)
-
-    def test_list_attestations_invalid_limit_zero(self, client):
-        """Test that limit must be at least 1"""
-        with pytest.raises(ValueError, match="limit must be between 1 and 5000"):
-            client.list_attestations(limit=0)
-
-    def test_list_attestations_invalid_limit_too_high(self, client):
-        """Test that limit cannot exceed 5000"""
-        with pytest.raises(ValueError, match="limit must be between 1 and 5000"):
-            client.list_attestations(limit=5001)
-
-    def test_list_attestations_negative_offset(self, client):
-        """Test that offset must be non-negative"""
+    @pytest.mark.parametrize(
+        "kwargs,match",
+        [
+            ({"requester": _REQ_21}, "requester must be at most 20 bytes"),
+            ({"limit": 0}, "limit must be between 1 and 5000"),
+            ({"limit": 5001}, "limit must be between 1 and 5000"),
+            ({"offset": -1}, "offset must be non-negative"),
+            ({"order_by": "invalid_column asc"}, "order_by must be one of"),
+        ],
+        ids=["long_requester", "limit_zero", "limit_too_high", "neg_offset", "bad_order_by"],
+    )
+    def test_list_attestations_invalid_input(self, offline_client, kwargs, match):
+        """Test that each invalid list_attestations argument is rejected"""
+        ok, msg = offline_client._validate_list_attestations(**kwargs)
+        assert not ok
+        assert re.search(match, msg)
+
+    def test_list_attestations_raises_on_invalid_input(self, offline_client):
+        """Test that list_attestations surfaces validation failures as ValueError"""
         with pytest.raises(ValueError, match="offset must be non-negative"):
-            client.list_attestations(offset=-1)
-
-    def test_list_attestations_invalid_order_by(self, client):
-        """Test that order_by must be from allowed list"""
-        with pytest.raises(ValueError, match="order_by must be one of"):
-            client.list_attestations(order_by="invalid_column asc")
+            offline_client.list_attestations(offset=-1)
 
-    def test_list_attestations_valid_order_by_values(self, client):
-        """Test that all valid order_by values are accepted (case-insensitive)"""
-        # These should not raise exceptions (they'll fail later trying to connect)
-        valid_values = [
+    @pytest.mark.parametrize(
+        "order_by",
+        [
             "created_height asc",
             "created_height desc",
             "signed_height asc",
             "signed_height desc",
             "CREATED_HEIGHT ASC",  # Case insensitive
             "Signed_Height Desc",  # Mixed case
-        ]
-
-        for order_by in valid_values:
-            # We expect this to fail with connection error, not validation error
-            try:
-                client.list_attestations(order_by=order_by, limit=1)
-            except ValueError as e:
-                # Should not be a validation error about order_by
-                assert "order_by must be one of" not in str(e)
-            except Exception:
-                # Connection or other errors are fine - we just want to pass validation
-                pass
+        ],
+    )
+    def test_list_attestations_valid_order_by_values(self, offline_client, order_by):
+        """Test that all valid order_by values are accepted (case-insensitive)"""
+        ok, msg = offline_client._validate_list_attestations(order_by=order_by, limit=1)
+        assert ok, msg
 
 
 class TestAttestationTypeConversions:
@@ -195,8 +167,8 @@ class TestAttestationTypeConversions:
         # Should not raise validation error
         try:
             client.request_attestation(
-                data_provider="0x" + "1" * 40,
-                stream_id="st" + "0" * 30,
+                data_provider=_DP_1S,
+                stream_id=_SID_ZEROS,
                 action_name="get_record",
                 args=args,
                 wait=False,
@@ -218,8 +190,8 @@ class TestAttestationEdgeCases:
         """Test minimum valid values"""
         try:
             client.request_attestation(
-                data_provider="0x" + "0" * 40,
-                stream_id="st" + "0" * 30,
+                data_provider=_DP_0S,
+                stream_id=_SID_ZEROS,
                 action_name="a",  # Single character
                 args=[],
                 max_fee="0",  # Zero fee
@@ -236,30 +208,25 @@ class TestAttestationEdgeCases:
             # Connection errors are fine
             pass
 
-    def test_list_attestations_valid_boundary_values(self, client):
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{"limit": 1, "offset": 0}, {"limit": 5000}],
+        ids=["min_limit", "max_limit"],
+    )
+    def test_list_attestations_valid_boundary_values(self, client, kwargs):
         """Test boundary values for limit and offset"""
         try:
-            # Minimum limit
-            client.list_attestations(limit=1, offset=0)
+            client.list_attestations(**kwargs)
         except ValueError as e:
             if "limit" in str(e) or "offset" in str(e):
-                pytest.fail(f"Should accept minimum boundary values: {e}")
-        except Exception:
-            pass
-
-        try:
-            # Maximum limit
-            client.list_attestations(limit=5000)
-        except ValueError as e:
-            if "limit" in str(e):
-                pytest.fail(f"Should accept maximum limit: {e}")
+                pytest.fail(f"Should accept boundary values {kwargs}: {e}")
         except Exception:
             pass
 
     def test_list_attestations_requester_exactly_20_bytes(self, client):
         """Test that requester with exactly 20 bytes is accepted"""
         try:
-            client.list_attestations(requester=b"x" * 20)
+            client.list_attestations(requester=_REQ_20)
         except ValueError as e:
             if "requester" in str(e):
                 pytest.fail(f"Should accept exactly 20 bytes: {e}")
@@ -270,10 +237,50 @@ class TestAttestationEdgeCases:
     def test_list_attestations_requester_less_than_20_bytes(self, client):
         """Test that requester with less than 20 bytes is accepted"""
         try:
-            client.list_attestations(requester=b"x" * 10)
+            client.list_attestations(requester=_REQ_10)
         except ValueError as e:
             if "requester" in str(e):
                 pytest.fail(f"Should accept less than 20 bytes: {e}")
         except Exception:
             # Connection errors are fine
             pass
+
+
+class TestAttestationRecord:
+    """Test the dict-style access kept on list_attestations rows"""
+
+    RECORD = AttestationRecord(
+        request_tx_id="tx",
+        attestation_hash=b"\x01",
+        requester=_REQ_20,
+        created_height=7,
+        signed_height=None,
+        encrypt_sig=False,
+    )
+
+    def test_subscript_and_contains(self):
+        assert self.RECORD["created_height"] == 7
+        assert "signed_height" in self.RECORD
+        assert "missing" not in self.RECORD
+        with pytest.raises(KeyError):
+            self.RECORD["missing"]
+
+    def test_get_and_keys(self):
+        assert self.RECORD.get("requester") == _REQ_20
+        assert self.RECORD.get("missing") is None
+        assert self.RECORD.get("missing", 0) == 0
+        assert list(self.RECORD.keys()) == [
+            "request_tx_id",
+            "attestation_hash",
+            "requester",
+            "created_height",
+            "signed_height",
+            "encrypt_sig",
+        ]
+
+    def test_dict_conversion(self):
+        as_dict = dict(self.RECORD)
+        assert as_dict["request_tx_id"] == "tx"
+        assert as_dict["signed_height"] is None
+        # Not a dict itself: compare through dict()
+        assert self.RECORD != as_dict
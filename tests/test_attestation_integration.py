@@ -13,43 +13,83 @@ properly configured and available.
 import pytest
 
 # Skip all tests in this module - attestation requires bridge precompile
-pytestmark = pytest.mark.skip(
-    reason="Attestation execution requires ethereum_bridge precompile. "
-    "See trufnetwork/node repository tests for full E2E testing."
-)
+pytestmark = [
+    pytest.mark.integration,
+    pytest.mark.skip(
+        reason="Attestation execution requires ethereum_bridge precompile. "
+        "See trufnetwork/node repository tests for full E2E testing."
+    ),
+]
 import time
-from trufnetwork_sdk_py.client import TNClient, STREAM_TYPE_PRIMITIVE
+import uuid
+from trufnetwork_sdk_py.client import (
+    SIGNATURE_OVERHEAD,
+    STREAM_TYPE_PRIMITIVE,
+    AttestationNotReadyError,
+    AttestationRecord,
+)
 from trufnetwork_sdk_py.utils import generate_stream_id
 
-# Test configuration
-TEST_PRIVATE_KEY = "0121234567890123456789012345678901234567890123456789012345178901"
+# Fixed-length inputs shared by the tests
+_FAKE_TX_ID = "0" * 64
+_FAKE_STREAM_ID = "st" + "f" * 30  # Non-existent stream
+_SHORT_PAYLOAD = b"\x00" * 50  # Shorter than the signature itself
 
 
-@pytest.fixture(scope="module")
-def client(tn_node, grant_network_writer):
+def _record_args(data_provider, stream_id, lookback=86400, now=None):
     """
-    Pytest fixture to create a TNClient instance for testing.
-    Uses the tn_node fixture to get a running server.
+    Positional args for get_record over the last `lookback` seconds:
+    (data_provider, stream_id, from, to, frozen_at, use_cache).
     """
-    client = TNClient(tn_node, TEST_PRIVATE_KEY)
-    grant_network_writer(client)
-    return client
+    now = now or int(time.time())
+    return [data_provider, stream_id, now - lookback, now, None, False]
 
 
-@pytest.fixture(scope="module")
-def test_stream_with_data(client):
+def wait_for_signed_attestation(client, request_tx_id, timeout=30.0):
     """
-    Fixture that creates a test stream with sample data for attestation tests.
-    Returns (stream_id, data_provider, record_count).
+    Poll get_signed_attestation until the payload carries a signature or the
+    timeout expires.
+
+    Polls with exponential backoff, 50ms doubling up to 2s, retrying only
+    while the attestation is not signed yet; any other error propagates.
+    Returns the last payload seen, which may be unsigned or None.
     """
-    stream_id = generate_stream_id("test_attestation_stream")
-    data_provider = client.get_current_account()
+    deadline = time.monotonic() + timeout
+    delay = 0.05
+    payload = None
+    while True:
+        try:
+            return client.get_signed_attestation(request_tx_id, require_signed=True)
+        except AttestationNotReadyError as e:
+            payload = e.payload
 
-    # Cleanup in case the stream already exists
-    try:
-        client.destroy_stream(stream_id)
-    except Exception:
-        pass
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return payload
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, 2.0)
+
+
+@pytest.fixture(scope="session")
+def current_account(client):
+    """
+    The client's account, looked up once for the session.
+    Returns (address, address_bytes) with the 0x prefix stripped from the bytes.
+    """
+    address = client.get_current_account()
+    return address, bytes.fromhex(address[2:])
+
+
+@pytest.fixture(scope="session")
+def test_stream_with_data(client, current_account):
+    """
+    A primitive stream with three records, deployed once for the session and
+    destroyed at teardown.
+    Returns (stream_id, data_provider, record_count).
+    """
+    # Unique per run, so a stream left behind by an aborted run never collides
+    stream_id = generate_stream_id(f"test_attestation_stream_{uuid.uuid4().hex[:8]}")
+    data_provider, _ = current_account
 
     # Deploy stream
     client.deploy_stream(stream_id, STREAM_TYPE_PRIMITIVE)
@@ -62,8 +102,7 @@ def test_stream_with_data(client):
         {"date": now, "value": 200.0},  # Now
     ]
 
-    for record in test_records:
-        client.insert_record(stream_id, record)
+    client.insert_records(stream_id, test_records)
 
     yield (stream_id, data_provider, len(test_records))
 
@@ -74,6 +113,49 @@ def test_stream_with_data(client):
         pass
 
 
+@pytest.fixture(scope="session")
+def seeded_attestation(client, test_stream_with_data):
+    """
+    A single get_record attestation requested once for the session, for tests
+    that only need an existing attestation.
+    Returns (stream_id, data_provider, request_tx_id).
+    """
+    stream_id, data_provider, _ = test_stream_with_data
+    request_tx_id = client.request_attestation(
+        data_provider=data_provider,
+        stream_id=stream_id,
+        action_name="get_record",
+        args=_record_args(data_provider, stream_id),
+        max_fee="100000000000000000000",
+        wait=True,
+    )
+    return (stream_id, data_provider, request_tx_id)
+
+
+@pytest.fixture(scope="session")
+def three_attestations(client, test_stream_with_data):
+    """
+    Three get_record attestations shared by the pagination and ordering tests.
+    They are broadcast back-to-back and confirmed together.
+    Returns the request_tx_ids in request order.
+    """
+    stream_id, data_provider, _ = test_stream_with_data
+    args = _record_args(data_provider, stream_id)
+    request_tx_ids = [
+        client.request_attestation(
+            data_provider=data_provider,
+            stream_id=stream_id,
+            action_name="get_record",
+            args=args,
+            max_fee="100000000000000000000",
+            wait=False,
+        )
+        for _ in range(3)
+    ]
+    client.wait_for_txs(request_tx_ids)
+    return request_tx_ids
+
+
 class TestAttestationFullWorkflow:
     """Test the complete attestation workflow"""
 
@@ -81,19 +163,8 @@ class TestAttestationFullWorkflow:
         """Test successful attestation request"""
         stream_id, data_provider, _ = test_stream_with_data
 
-        # Prepare query parameters
-        now = int(time.time())
-        week_ago = now - (7 * 24 * 60 * 60)
-
-        # Arguments for get_record action
-        args = [
-            data_provider,
-            stream_id,
-            week_ago,
-            now,
-            None,  # frozen_at
-            False,  # use_cache
-        ]
+        # Arguments for get_record action over the last week
+        args = _record_args(data_provider, stream_id, lookback=7 * 86400)
 
         # Request attestation
         request_tx_id = client.request_attestation(
@@ -111,62 +182,26 @@ class TestAttestationFullWorkflow:
         assert isinstance(request_tx_id, str)
         assert len(request_tx_id) == 64  # 64 hex chars (no 0x prefix)
 
-    def test_get_signed_attestation_polling(self, client, test_stream_with_data):
+    def test_get_signed_attestation_polling(self, client, seeded_attestation):
         """Test retrieving signed attestation with polling"""
-        stream_id, data_provider, _ = test_stream_with_data
-
-        # Request attestation
-        now = int(time.time())
-        week_ago = now - (7 * 24 * 60 * 60)
-
-        request_tx_id = client.request_attestation(
-            data_provider=data_provider,
-            stream_id=stream_id,
-            action_name="get_record",
-            args=[data_provider, stream_id, week_ago, now, None, False],
-            max_fee="100000000000000000000",
-            wait=True,
-        )
+        _, _, request_tx_id = seeded_attestation
 
         # Poll for signed attestation (max 30 seconds)
-        max_attempts = 15
-        payload = None
-
-        for attempt in range(max_attempts):
-            try:
-                payload = client.get_signed_attestation(request_tx_id)
-                # Check if signature is present (payload should be > 65 bytes when signed)
-                if payload and len(payload) > 65:
-                    break
-            except Exception:
-                pass
-
-            if attempt < max_attempts - 1:
-                time.sleep(2)
+        payload = wait_for_signed_attestation(client, request_tx_id)
 
         # Verify we got a payload (may or may not be signed yet)
         assert payload is not None
         assert isinstance(payload, bytes)
 
-        # If signed, verify minimum length
-        if len(payload) > 65:
-            # Has signature (already verified len > 65)
-            pass
+        # If signed, the signature must verify and split off the payload cleanly
+        if len(payload) > SIGNATURE_OVERHEAD:
+            verification = client.verify_attestation_signature(payload)
+            assert len(verification["signature"]) == SIGNATURE_OVERHEAD
+            assert verification["canonical_payload"] + verification["signature"] == payload
 
-    def test_list_attestations_default_params(self, client, test_stream_with_data):
+    def test_list_attestations_default_params(self, client, seeded_attestation):
         """Test listing attestations with default parameters"""
-        stream_id, data_provider, _ = test_stream_with_data
-
-        # Create at least one attestation first
-        now = int(time.time())
-        request_tx_id = client.request_attestation(
-            data_provider=data_provider,
-            stream_id=stream_id,
-            action_name="get_record",
-            args=[data_provider, stream_id, now - 86400, now, None, False],
-            max_fee="100000000000000000000",
-            wait=True,
-        )
+        # seeded_attestation guarantees at least one attestation exists
 
         # List all attestations (no filter)
         attestations = client.list_attestations()
@@ -176,29 +211,19 @@ class TestAttestationFullWorkflow:
         # Note: May be empty if attestations are stored per-user
         # or may contain attestations from other tests
 
-    def test_list_attestations_with_requester_filter(self, client, test_stream_with_data):
+    def test_list_attestations_with_requester_filter(
+        self, client, seeded_attestation, current_account
+    ):
         """Test listing attestations filtered by requester"""
-        stream_id, data_provider, _ = test_stream_with_data
+        _, _, request_tx_id = seeded_attestation
 
-        # Create an attestation
-        now = int(time.time())
-        request_tx_id = client.request_attestation(
-            data_provider=data_provider,
-            stream_id=stream_id,
-            action_name="get_record",
-            args=[data_provider, stream_id, now - 86400, now, None, False],
-            max_fee="100000000000000000000",
-            wait=True,
-        )
-
-        # Get current account as requester
-        my_address = client.get_current_account()
-        my_address_bytes = bytes.fromhex(my_address[2:])  # Remove 0x prefix
+        # Current account as requester
+        _, my_address_bytes = current_account
 
         # List attestations for current user
         attestations = client.list_attestations(
             requester=my_address_bytes,
-            limit=10,
+            limit=100,  # the shared attestation may not be the newest
             order_by="created_height desc",
         )
 
@@ -220,23 +245,8 @@ class TestAttestationFullWorkflow:
                 a["request_tx_id"] == request_tx_id for a in attestations
             ), "Our attestation should be in the list"
 
-    def test_list_attestations_pagination(self, client, test_stream_with_data):
+    def test_list_attestations_pagination(self, client, three_attestations):
         """Test pagination in list_attestations"""
-        stream_id, data_provider, _ = test_stream_with_data
-
-        # Create multiple attestations
-        now = int(time.time())
-        for i in range(3):
-            client.request_attestation(
-                data_provider=data_provider,
-                stream_id=stream_id,
-                action_name="get_record",
-                args=[data_provider, stream_id, now - 86400, now, None, False],
-                max_fee="100000000000000000000",
-                wait=True,
-            )
-            time.sleep(0.5)  # Small delay between requests
-
         # Get first page
         page1 = client.list_attestations(limit=2, offset=0)
 
@@ -255,23 +265,8 @@ class TestAttestationFullWorkflow:
             # Pages should not have overlapping IDs
             assert len(page1_ids & page2_ids) == 0, "Pages should not overlap"
 
-    def test_list_attestations_ordering(self, client, test_stream_with_data):
+    def test_list_attestations_ordering(self, client, three_attestations):
         """Test ordering in list_attestations"""
-        stream_id, data_provider, _ = test_stream_with_data
-
-        # Create multiple attestations
-        now = int(time.time())
-        for i in range(3):
-            client.request_attestation(
-                data_provider=data_provider,
-                stream_id=stream_id,
-                action_name="get_record",
-                args=[data_provider, stream_id, now - 86400, now, None, False],
-                max_fee="100000000000000000000",
-                wait=True,
-            )
-            time.sleep(0.5)
-
         # Get ascending order
         asc = client.list_attestations(
             limit=10,
@@ -297,28 +292,18 @@ class TestAttestationFullWorkflow:
                     desc[i]["created_height"] >= desc[i + 1]["created_height"]
                 ), "Descending order should be maintained"
 
-    def test_attestation_metadata_structure(self, client, test_stream_with_data):
+    def test_attestation_metadata_structure(
+        self, client, seeded_attestation, current_account
+    ):
         """Test that attestation metadata has correct structure"""
-        stream_id, data_provider, _ = test_stream_with_data
-
-        # Create an attestation
-        now = int(time.time())
-        request_tx_id = client.request_attestation(
-            data_provider=data_provider,
-            stream_id=stream_id,
-            action_name="get_record",
-            args=[data_provider, stream_id, now - 86400, now, None, False],
-            max_fee="100000000000000000000",
-            wait=True,
-        )
+        _, _, request_tx_id = seeded_attestation
 
         # Get attestations
-        my_address = client.get_current_account()
-        my_address_bytes = bytes.fromhex(my_address[2:])
+        _, my_address_bytes = current_account
 
         attestations = client.list_attestations(
             requester=my_address_bytes,
-            limit=1,
+            limit=100,  # the shared attestation may not be the newest
             order_by="created_height desc",
         )
 
@@ -329,22 +314,14 @@ class TestAttestationFullWorkflow:
                 our_attestation = att
                 break
 
-        if our_attestation:
-            # Verify all fields are present
-            assert isinstance(our_attestation["request_tx_id"], str)
-            assert isinstance(our_attestation["attestation_hash"], bytes)
-            assert isinstance(our_attestation["requester"], bytes)
-            assert isinstance(our_attestation["created_height"], int)
-            assert our_attestation["signed_height"] is None or isinstance(
-                our_attestation["signed_height"], int
-            )
-            assert isinstance(our_attestation["encrypt_sig"], bool)
+        assert all(isinstance(att, AttestationRecord) for att in attestations)
 
+        if our_attestation:
             # Verify values
-            assert our_attestation["request_tx_id"] == request_tx_id
-            assert len(our_attestation["requester"]) == 20  # 20 bytes
-            assert our_attestation["created_height"] > 0
-            assert our_attestation["encrypt_sig"] == False  # MVP restriction
+            assert our_attestation.request_tx_id == request_tx_id
+            assert len(our_attestation.requester) == 20  # 20 bytes
+            assert our_attestation.created_height > 0
+            assert our_attestation.encrypt_sig is False  # MVP restriction
 
 
 class TestAttestationErrorHandling:
@@ -360,7 +337,7 @@ class TestAttestationErrorHandling:
     def test_get_signed_attestation_nonexistent_tx_id(self, client):
         """Test retrieving attestation for non-existent transaction"""
         # Use well-formed but non-existent tx ID (64 hex chars without 0x prefix)
-        fake_tx_id = "0" * 64
+        fake_tx_id = _FAKE_TX_ID
 
         try:
             payload = client.get_signed_attestation(fake_tx_id)
@@ -372,14 +349,14 @@ class TestAttestationErrorHandling:
             # Expected - attestation doesn't exist
             pass
 
-    def test_request_attestation_invalid_stream(self, client):
+    def test_request_attestation_invalid_stream(self, client, current_account):
         """Test requesting attestation for non-existent stream
 
         Note: The request may succeed even for non-existent streams,
         as validation happens during attestation computation, not at request time.
         """
-        data_provider = client.get_current_account()
-        fake_stream_id = "st" + "f" * 30  # Non-existent stream
+        data_provider, _ = current_account
+        fake_stream_id = _FAKE_STREAM_ID
         now = int(time.time())
 
         # Request may succeed - the actual failure happens when validators try to compute the attestation
@@ -451,14 +428,11 @@ class TestAttestationPayloadParsing:
         stream_id, data_provider, _ = test_stream_with_data
 
         # 1. Request attestation
-        now = int(time.time())
-        week_ago = now - (7 * 24 * 60 * 60)
-
         request_tx_id = client.request_attestation(
             data_provider=data_provider,
             stream_id=stream_id,
             action_name="get_record",
-            args=[data_provider, stream_id, week_ago, now, None, False],
+            args=_record_args(data_provider, stream_id, lookback=7 * 86400),
             max_fee="100000000000000000000",
             wait=True,
         )
@@ -467,24 +441,11 @@ class TestAttestationPayloadParsing:
         assert isinstance(request_tx_id, str)
 
         # 2. Poll for signed attestation (max 30 seconds)
-        max_attempts = 15
-        signed_payload = None
-
-        for attempt in range(max_attempts):
-            try:
-                signed_payload = client.get_signed_attestation(request_tx_id)
-                # Check if signature is present (payload should be >= 66 bytes when signed)
-                if signed_payload and len(signed_payload) >= 66:
-                    break
-            except Exception:
-                pass
-
-            if attempt < max_attempts - 1:
-                time.sleep(2)
+        signed_payload = wait_for_signed_attestation(client, request_tx_id)
 
         # Verify we got a signed payload
         assert signed_payload is not None, "Failed to get signed attestation"
-        assert len(signed_payload) >= 66, f"Payload too short: {len(signed_payload)} bytes"
+        assert len(signed_payload) >= SIGNATURE_OVERHEAD + 1, f"Payload too short: {len(signed_payload)} bytes"
 
         # 3. Verify signature and extract validator address
         verification = client.verify_attestation_signature(signed_payload)
@@ -492,8 +453,8 @@ class TestAttestationPayloadParsing:
         assert "validator_address" in verification
         assert verification["validator_address"].startswith("0x")
         assert len(verification["validator_address"]) == 42  # 0x + 40 hex chars
-        assert len(verification["canonical_payload"]) == len(signed_payload) - 65
-        assert len(verification["signature"]) == 65
+        assert len(verification["canonical_payload"]) == len(signed_payload) - SIGNATURE_OVERHEAD
+        assert len(verification["signature"]) == SIGNATURE_OVERHEAD
 
         print(f"✓ Validator Address: {verification['validator_address']}")
 
@@ -535,42 +496,33 @@ class TestAttestationPayloadParsing:
         # Should reject payload shorter than minimum
         with pytest.raises(ValueError, match="Payload too short"):
             # Try to verify signature on a short payload
-            client.verify_attestation_signature(b"\x00" * 50)
+            client.verify_attestation_signature(_SHORT_PAYLOAD)
 
     def test_verify_signature_extracts_components_correctly(self, client, test_stream_with_data):
         """Test that verify_attestation_signature extracts payload and signature correctly"""
         stream_id, data_provider, _ = test_stream_with_data
 
         # Request and get signed attestation
-        now = int(time.time())
         request_tx_id = client.request_attestation(
             data_provider=data_provider,
             stream_id=stream_id,
             action_name="get_record",
-            args=[data_provider, stream_id, now - 86400, now, None, False],
+            args=_record_args(data_provider, stream_id),
             max_fee="100000000000000000000",
             wait=True,
         )
 
         # Poll for signed attestation
-        signed_payload = None
-        for _ in range(15):
-            try:
-                signed_payload = client.get_signed_attestation(request_tx_id)
-                if signed_payload and len(signed_payload) >= 66:
-                    break
-            except Exception:
-                pass
-            time.sleep(2)
+        signed_payload = wait_for_signed_attestation(client, request_tx_id)
 
         # Ensure we got a valid signed payload
         assert signed_payload is not None, "Failed to get signed attestation within timeout"
-        assert len(signed_payload) >= 66, f"Payload too short: {len(signed_payload)} bytes"
+        assert len(signed_payload) >= SIGNATURE_OVERHEAD + 1, f"Payload too short: {len(signed_payload)} bytes"
 
         verification = client.verify_attestation_signature(signed_payload)
 
         # Verify the signature is exactly 65 bytes
-        assert len(verification["signature"]) == 65
+        assert len(verification["signature"]) == SIGNATURE_OVERHEAD
 
         # Verify canonical_payload + signature equals original
         reconstructed = verification["canonical_payload"] + verification["signature"]
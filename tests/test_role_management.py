@@ -1,5 +1,5 @@
 import pytest
-from trufnetwork_sdk_py import TNClient
+from trufnetwork_sdk_py import TNClient, WalletSet
 from trufnetwork_sdk_py.utils import generate_stream_id
 
 from tests.fixtures.test_trufnetwork import manager_client 
@@ -64,6 +64,41 @@ class TestRoleManagement:
         assert not revoke_status[0]["is_member"], "User should not be a member after revoke_role"
 
 
+    def test_grant_and_revoke_roles_batch(self, manager_client: TNClient, user_client: TNClient, another_user_client: TNClient):
+        """
+        Verifies that batched grants/revocations land one transaction per entry and are all confirmed.
+        """
+        wallets = [user_client.get_current_account(), another_user_client.get_current_account()]
+        changes = [
+            {"owner": SYSTEM_OWNER, "role_name": NETWORK_WRITER_ROLE, "wallets": [wallet]}
+            for wallet in wallets
+        ]
+
+        grant_txs = manager_client.grant_roles_batch(changes)
+        assert len(grant_txs) == len(changes)
+        status = manager_client.are_members_of(SYSTEM_OWNER, NETWORK_WRITER_ROLE, wallets)
+        assert all(s["is_member"] for s in status), "All wallets should be members after grant_roles_batch"
+
+        revoke_txs = manager_client.revoke_roles_batch(changes)
+        assert len(revoke_txs) == len(changes)
+        status = manager_client.are_members_of(SYSTEM_OWNER, NETWORK_WRITER_ROLE, wallets)
+        assert not any(s["is_member"] for s in status), "No wallet should be a member after revoke_roles_batch"
+
+    def test_wallet_set_reused_across_role_calls(self, manager_client: TNClient, user_client: TNClient, another_user_client: TNClient):
+        """
+        Verifies that a WalletSet can be passed to grant/revoke/are_members_of repeatedly.
+        """
+        wallets = WalletSet([user_client.get_current_account(), another_user_client.get_current_account()])
+
+        manager_client.grant_role(SYSTEM_OWNER, NETWORK_WRITER_ROLE, wallets, wait=True)
+        status = manager_client.are_members_of(SYSTEM_OWNER, NETWORK_WRITER_ROLE, wallets)
+        assert len(status) == len(wallets)
+        assert all(s["is_member"] for s in status), "All wallets should be members after grant_role"
+
+        manager_client.revoke_role(SYSTEM_OWNER, NETWORK_WRITER_ROLE, wallets, wait=True)
+        status = manager_client.are_members_of(SYSTEM_OWNER, NETWORK_WRITER_ROLE, wallets)
+        assert not any(s["is_member"] for s in status), "No wallet should be a member after revoke_role"
+
     @skip_until_stream_creation_fee_funded
     def test_network_writer_role_permission_gate(self, manager_client: TNClient, user_client: TNClient):
         """
@@ -121,6 +121,76 @@ def test_insert_and_retrieve_records(client):
     client.destroy_stream(stream_id)
 
 
+@skip_until_stream_creation_fee_funded
+def test_get_records_columns(client):
+    """
+    Test that the columnar reader returns the same data as get_records.
+    """
+    np = pytest.importorskip("numpy")
+    stream_id = generate_stream_id("test_stream_records_columns")
+
+    # Cleanup in case the stream already exists from a previous test run
+    try:
+        client.destroy_stream(stream_id)
+    except Exception:
+        pass
+
+    client.deploy_stream(stream_id)
+
+    records_to_insert = [
+        {"date": date_string_to_unix("2023-01-01"), "value": 10.5},
+        {"date": date_string_to_unix("2023-01-02"), "value": 12.2},
+        {"date": date_string_to_unix("2023-01-03"), "value": 8.8},
+    ]
+    client.insert_records(stream_id, records_to_insert)
+
+    dates, values = client.get_records_columns(
+        stream_id,
+        date_from=date_string_to_unix("2023-01-01"),
+        date_to=date_string_to_unix("2023-01-03"),
+    )
+    assert dates.dtype == np.int64
+    assert values.dtype == np.float64
+    assert dates.tolist() == [r["date"] for r in records_to_insert]
+    assert values.tolist() == [r["value"] for r in records_to_insert]
+
+    # Clean up
+    client.destroy_stream(stream_id)
+
+
+@skip_until_stream_creation_fee_funded
+def test_get_records_tuples(client):
+    """
+    Test that the tuple reader returns the same data as get_records.
+    """
+    stream_id = generate_stream_id("test_stream_records_tuples")
+
+    # Cleanup in case the stream already exists from a previous test run
+    try:
+        client.destroy_stream(stream_id)
+    except Exception:
+        pass
+
+    client.deploy_stream(stream_id)
+
+    records_to_insert = [
+        {"date": date_string_to_unix("2023-01-01"), "value": 10.5},
+        {"date": date_string_to_unix("2023-01-02"), "value": 12.2},
+    ]
+    client.insert_records(stream_id, records_to_insert)
+
+    rows = client.get_records_tuples(
+        stream_id,
+        date_from=date_string_to_unix("2023-01-01"),
+        date_to=date_string_to_unix("2023-01-02"),
+    )
+    assert rows == [(r["date"], r["value"]) for r in records_to_insert]
+    assert rows[0].date == records_to_insert[0]["date"]
+
+    # Clean up
+    client.destroy_stream(stream_id)
+
+
 @skip_until_stream_creation_fee_funded
 def test_get_first_record(client: TNClient):
     """Test getting the first record from a stream."""
@@ -215,6 +285,83 @@ def test_get_index(client):
     client.destroy_stream(stream_id)
 
 
+@skip_until_stream_creation_fee_funded
+def test_get_index_columns(client):
+    """
+    Test that the columnar index reader returns the same data as get_index.
+    """
+    np = pytest.importorskip("numpy")
+    stream_id = generate_stream_id("test_stream_index_columns")
+
+    # Cleanup in case the stream already exists from a previous test run
+    try:
+        client.destroy_stream(stream_id)
+    except Exception:
+        pass
+
+    client.deploy_stream(stream_id)
+
+    records_to_insert = [
+        {"date": date_string_to_unix("2023-01-01"), "value": 10.5},
+        {"date": date_string_to_unix("2023-01-02"), "value": 12.2},
+    ]
+    client.insert_records(stream_id, records_to_insert)
+    expected_values = [
+        round(r["value"] / records_to_insert[0]["value"] * 100, 3)
+        for r in records_to_insert
+    ]
+
+    dates, values = client.get_index_columns(
+        stream_id,
+        date_from=date_string_to_unix("2023-01-01"),
+        date_to=date_string_to_unix("2023-01-02"),
+    )
+    assert dates.dtype == np.int64
+    assert values.dtype == np.float64
+    assert dates.tolist() == [r["date"] for r in records_to_insert]
+    assert [round(v, 3) for v in values.tolist()] == expected_values
+
+    # Clean up
+    client.destroy_stream(stream_id)
+
+
+@skip_until_stream_creation_fee_funded
+def test_get_index_tuples(client):
+    """
+    Test that the tuple index reader returns the same data as get_index.
+    """
+    stream_id = generate_stream_id("test_stream_index_tuples")
+
+    # Cleanup in case the stream already exists from a previous test run
+    try:
+        client.destroy_stream(stream_id)
+    except Exception:
+        pass
+
+    client.deploy_stream(stream_id)
+
+    records_to_insert = [
+        {"date": date_string_to_unix("2023-01-01"), "value": 10.5},
+        {"date": date_string_to_unix("2023-01-02"), "value": 12.2},
+    ]
+    client.insert_records(stream_id, records_to_insert)
+    expected_values = [
+        round(r["value"] / records_to_insert[0]["value"] * 100, 3)
+        for r in records_to_insert
+    ]
+
+    rows = client.get_index_tuples(
+        stream_id,
+        date_from=date_string_to_unix("2023-01-01"),
+        date_to=date_string_to_unix("2023-01-02"),
+    )
+    assert [row.date for row in rows] == [r["date"] for r in records_to_insert]
+    assert [round(row.value, 3) for row in rows] == expected_values
+
+    # Clean up
+    client.destroy_stream(stream_id)
+
+
 @skip_until_stream_creation_fee_funded
 def test_get_type(client):
     """
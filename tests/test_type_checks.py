@@ -0,0 +1,61 @@
+"""Pure unit tests for the all_is_list_of_* argument validators; no node needed."""
+
+import pytest
+
+from trufnetwork_sdk_py.client import all_is_list_of_floats, all_is_list_of_strings
+
+
+class _Str(str):
+    pass
+
+
+class _Float(float):
+    pass
+
+
+@pytest.mark.parametrize(
+    "arg_list,expected",
+    [
+        ([], True),
+        ([[], ["a"]], True),
+        ([["a", _Str("b")]], True),
+        ([["a", 1]], False),
+        ([["a"], "b"], False),  # outer items must be lists
+        ([["a"], [None]], False),
+    ],
+)
+def test_all_is_list_of_strings(arg_list, expected):
+    assert all_is_list_of_strings(arg_list) is expected
+
+
+@pytest.mark.parametrize(
+    "arg_list,expected",
+    [
+        ([], True),
+        ([[1, 2.5], []], True),
+        ([[True, _Float(1.5)]], True),  # isinstance semantics: bool and subclasses pass
+        ([[1.0, "2"]], False),
+        ([[1.0], 2.0], False),
+        ([[None]], False),
+    ],
+)
+def test_all_is_list_of_floats(arg_list, expected):
+    assert all_is_list_of_floats(arg_list) is expected
+
+
+def test_all_is_list_of_floats_accepts_numpy_scalars():
+    np = pytest.importorskip("numpy")
+    assert all_is_list_of_floats([[np.float64(1.5), 2]])
+
+
+def test_validators_stop_at_first_bad_item():
+    seen = []
+
+    class Tracking(list):
+        def __iter__(self):
+            for item in ("a", 1, "never"):
+                seen.append(item)
+                yield item
+
+    assert not all_is_list_of_strings([Tracking()])
+    assert seen == ["a", 1]
@@ -0,0 +1,57 @@
+"""Pure unit tests for the wait="async" submission mode.
+
+The insert wrappers and wait_for_tx_async are exercised against monkeypatched
+bindings on the offline_client fixture, so they need no node.
+"""
+
+import copy
+from concurrent.futures import Future
+
+import pytest
+
+import trufnetwork_sdk_py.client as client_mod
+from trufnetwork_sdk_py.client import TNClient
+
+
+def test_insert_records_async_returns_future(offline_client, monkeypatch):
+    waited = []
+    monkeypatch.setattr(client_mod, "_InsertRecords", lambda client, inputs: "0xabc")
+    monkeypatch.setattr(client_mod, "_WaitForTx", lambda client, tx: waited.append(tx))
+    monkeypatch.setattr(TNClient, "_new_insert_inputs", lambda self, batches: None)
+
+    fut = offline_client.insert_records("st1", [], wait="async")
+
+    assert isinstance(fut, Future)
+    assert fut.result(timeout=5) == "0xabc"
+    assert waited == ["0xabc"]
+
+
+def test_wait_for_tx_async_propagates_failure(offline_client, monkeypatch):
+    def fail(client, tx):
+        raise RuntimeError(f"tx {tx} failed")
+
+    monkeypatch.setattr(client_mod, "_WaitForTx", fail)
+
+    fut = offline_client.wait_for_tx_async("0xdead")
+
+    with pytest.raises(RuntimeError, match="0xdead"):
+        fut.result(timeout=5)
+
+
+def test_wait_pool_is_shared_across_clients(offline_client, monkeypatch):
+    monkeypatch.setattr(client_mod, "_WaitForTx", lambda client, tx: None)
+    monkeypatch.setattr(client_mod.truf_sdk, "GrantRole", lambda *args: "0xrole", raising=False)
+    monkeypatch.setattr(client_mod, "_Slice_string", list)
+
+    first_client, second_client = offline_client, copy.copy(offline_client)
+
+    first = first_client.grant_role("system", "network_writer", ["0x1"], wait="async")
+    pool = TNClient._wait_pool
+    second = second_client.wait_for_tx_async("0x2")
+
+    assert first.result(timeout=5) == "0xrole"
+    assert second.result(timeout=5) == "0x2"
+    assert pool is not None
+    assert TNClient._wait_pool is pool
+    assert "_wait_pool" not in vars(first_client)
+    assert "_wait_pool" not in vars(second_client)